@@ -39,9 +39,12 @@ once initialized.
 All helper functions are defensive and avoid raising unexpected exceptions.
 """
 
+import os
+import queue
 import logging
 
 from enum import Enum
+from typing import NamedTuple
 from datetime import datetime
 
 # --------------------------------------------------------------------------
@@ -69,6 +72,25 @@ DEFAULT_CAN_BIT_RATE = 1000000
 ## Setting this to 1 performs fsync after every row, which is safer but slower.
 FSYNC_EVERY = 50
 
+## Size (in bytes) after which buffered export rows are written to disk.
+## @details
+## Rows are also written out every @ref FSYNC_EVERY rows, whichever comes first.
+EXPORT_BUFFER_SIZE = 64 * 1024
+
+## Buffer size (in bytes) of the processed frame CSV export file.
+EXPORT_FILE_BUFFERING = 1 << 20
+
+## Maximum number of raw CSV rows queued for the export writer thread.
+## @details
+## Rows arriving while the queue is full are dropped (and counted) so that
+## disk stalls never block CAN reception.
+EXPORT_QUEUE_SIZE = 10000
+
+## Number of processed CSV rows collected before they are handed to the writer.
+## @details
+## Pending rows are also written out whenever the raw frame queue drains.
+EXPORT_ROW_BATCH = 64
+
 ## Default Logging level.
 ## @details
 ## Set default log level to INFO.
@@ -87,6 +109,9 @@ PROTOCOL_TABLE_HEIGHT = 15
 ## Width of the graphs in the CLI interface (in characters).
 STATS_GRAPH_WIDTH = 20
 
+## Refresh rate of the CLI interface (renders per second).
+CLI_REFRESH_HZ = 5
+
 ## Minimum number of values to be shown in Bus stats window.
 MIN_STATS_SHOW = 3
 
@@ -96,6 +121,20 @@ MAX_STATS_SHOW = 5
 ## Maximum number remote node control commands to store in CLI.
 MAX_CLI_CMD_HISTORY = 5
 
+## Number of processed frames batched locally before merging into bus stats.
+## @details
+## Pending counters are also merged whenever the raw frame queue drains.
+STATS_MERGE_EVERY = 256
+
+## Maximum number of queued items taken per lock acquisition by @ref drain_queue.
+QUEUE_DRAIN_BATCH = 256
+
+## Receive timeout (seconds) of the sniffer's `can.Notifier` thread.
+## @details
+## Frames wake the thread immediately; the timeout only bounds how long
+## stopping the receive thread may take.
+RECV_TIMEOUT = 0.5
+
 ## Maximum number of CANopen frames to be cached.
 MAX_FRAMES = 500
 
@@ -209,6 +248,32 @@ class frame_type(Enum):
     UNKNOWN = 9
 
 
+# --------------------------------------------------------------------------
+# ----- Structures -----
+# --------------------------------------------------------------------------
+class can_frame(NamedTuple):
+    """! Raw CAN frame passed from the sniffer to the processor.
+    @details
+    A tuple is cheaper to build and unpack per frame than a dict with
+    string keys.
+    """
+
+    ## Capture time (`time.time()`).
+    time: float
+
+    ## Direction: "rx" for received, "tx" for frames sent by the analyzer.
+    type: str
+
+    ## 11-bit COB-ID.
+    cob: int
+
+    ## Error frame flag ("" for transmitted frames).
+    error: bool | str
+
+    ## Frame payload.
+    raw: bytes | bytearray
+
+
 # --------------------------------------------------------------------------
 # ----- Logging -----
 # --------------------------------------------------------------------------
@@ -227,6 +292,9 @@ root_logger.setLevel(LOG_LEVEL)
 log = logging.getLogger(f"{APP_NAME}")
 log.addHandler(logging.NullHandler())
 
+## Set once file logging is enabled through @ref enable_logging.
+LOGGING_ENABLED = False
+
 def enable_logging():
     """! Enable file-only logging, enabled through argument."""
 
@@ -242,13 +310,46 @@ def enable_logging():
     )
 
     # Do NOT add a StreamHandler here — we want file-only logging when enabled through argument.
-    global log
+    global log, LOGGING_ENABLED
+    LOGGING_ENABLED = True
     log = logging.getLogger(f"{APP_NAME}")
     log.setLevel(LOG_LEVEL)
-    log.info(f"Logging enabled → {filename}")
+    log.info("Logging enabled → %s", filename)
+
+
+def is_debug_enabled(logger: logging.Logger) -> bool:
+    """! Check whether debug records of a logger would actually be written.
+    @details
+    Loggers default to DEBUG level with no real handlers, so this is used to
+    skip building per-frame debug messages that nobody consumes.
+    @param logger Logger to check.
+    @return True if logging is enabled and DEBUG passes the logger level.
+    """
+    return LOGGING_ENABLED and logger.isEnabledFor(logging.DEBUG)
+
+
+def is_warning_enabled(logger: logging.Logger) -> bool:
+    """! Check whether warning records of a logger would actually be written.
+    @details
+    Same as @ref is_debug_enabled for the WARNING level; used to guard
+    per-frame warnings (error frames, decode failures).
+    @param logger Logger to check.
+    @return True if logging is enabled and WARNING passes the logger level.
+    """
+    return LOGGING_ENABLED and logger.isEnabledFor(logging.WARNING)
 
 
+## "0x%03X" strings for all 11-bit COB-IDs (see @ref cob_str).
+COB_HEX = tuple(f"0x{i:03X}" for i in range(0x800))
+
 # ----- helpers -----
+def cob_str(cob: int) -> str:
+    """! Format a COB-ID as "0x%03X", using the precomputed @ref COB_HEX table.
+    @param cob COB-ID.
+    @return COB-ID string.
+    """
+    return COB_HEX[cob] if 0 <= cob < 0x800 else f"0x{cob:03X}"
+
 def now_str() -> str:
     """! Return current time string.
     @return Time string.
@@ -256,6 +357,13 @@ def now_str() -> str:
     """
     return datetime.now().strftime("%H:%M:%S.%f")[:-3]
 
+def time_str(ts: float) -> str:
+    """! Format a `time.time()` timestamp like @ref now_str.
+    @param ts Seconds since the epoch.
+    @return Time string.
+    """
+    return datetime.fromtimestamp(ts).strftime("%H:%M:%S.%f")[:-3]
+
 def bytes_to_hex(data) -> str:
     """! Convert bytes or bytearray to a space-separated hex string safely.
     @param data Byte stream.
@@ -264,6 +372,9 @@ def bytes_to_hex(data) -> str:
     """
     if data is None:
         return ""
+    # fast path: C-implemented hex conversion for byte buffers
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return data.hex(" ").upper()
     # if already a string, return it as-is
     if isinstance(data, str):
         return data
@@ -274,6 +385,43 @@ def bytes_to_hex(data) -> str:
         return str(data)
 
 
+def drain_queue(q, max_items: int) -> list:
+    """! Pop up to max_items from a `queue.Queue` under a single lock acquisition.
+    @details
+    Non-blocking bulk alternative to repeated `get_nowait()` calls. Drained
+    items are accounted as done (as if `task_done()` was called for each),
+    so `join()` on the queue keeps working. A `queue.SimpleQueue` has no
+    shared lock to take; it is drained with C-level `get_nowait()` calls,
+    bounded by `qsize()` so an empty queue does not cost an `Empty` raise.
+    @param q Queue to drain.
+    @param max_items Maximum number of items to take.
+    @return List of items in FIFO order (empty if the queue was empty).
+    """
+
+    if isinstance(q, queue.SimpleQueue):
+        items = []
+        get = q.get_nowait
+        append = items.append
+        try:
+            for _ in range(min(max_items, q.qsize())):
+                append(get())
+        except queue.Empty:
+            pass
+        return items
+
+    with q.mutex:
+        n = min(max_items, len(q.queue))
+        if not n:
+            return []
+        popleft = q.queue.popleft
+        items = [popleft() for _ in range(n)]
+        q.unfinished_tasks -= n
+        if q.unfinished_tasks <= 0:
+            q.all_tasks_done.notify_all()
+        q.not_full.notify_all()
+    return items
+
+
 def clean_int_with_comment(val: str) -> int:
     """! Get value after splitting the string.
     @param val Input string.
@@ -282,3 +430,28 @@ def clean_int_with_comment(val: str) -> int:
 
     return int(val.split(";", 1)[0].strip(), 0)
 
+
+def apply_thread_scheduling(logger: logging.Logger, cpu_affinity: int | None = None, rt_priority: int | None = None):
+    """! Pin the calling thread to a CPU and/or switch it to real-time scheduling.
+    @details
+    Reduces preemption jitter for the sniffer/processor threads on busy hosts.
+    Both settings are best-effort: unsupported platforms or missing
+    privileges (SCHED_FIFO normally requires root) only log a warning.
+    @param logger Logger used to report the outcome.
+    @param cpu_affinity CPU index to pin to, or None to keep the default.
+    @param rt_priority SCHED_FIFO priority (1-99), or None to keep the default.
+    """
+
+    if cpu_affinity is not None:
+        try:
+            os.sched_setaffinity(0, {cpu_affinity})
+            logger.info("Thread pinned to CPU %d", cpu_affinity)
+        except (AttributeError, OSError, ValueError) as e:
+            logger.warning("Failed to set CPU affinity %s: %s", cpu_affinity, e)
+
+    if rt_priority is not None:
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(rt_priority))
+            logger.info("Thread scheduling set to SCHED_FIFO (priority=%d)", rt_priority)
+        except (AttributeError, OSError, ValueError) as e:
+            logger.warning("Failed to set real-time priority %s: %s", rt_priority, e)
@@ -74,7 +74,8 @@ class bus_stats:
         ## @details
         ## Keys correspond to message types (e.g., NMT, PDO, SDO, etc.).
         ## Values represent how many frames of each type have been received.
-        counts : dict = field(default_factory=lambda: dict.fromkeys(analyzer_defs.frame_type, 0))
+        ## Kept as a Counter so displays can use most_common() for the top-N view.
+        counts : Counter = field(default_factory=lambda: Counter(dict.fromkeys(analyzer_defs.frame_type, 0)))
 
 
     @dataclass
@@ -125,7 +126,7 @@ class bus_stats:
         # List of rate keys we track. Keep this small & canonical.
         keys: list = field(default_factory=lambda: ['total', 'hb', 'emcy', 'pdo', 'sdo_res', 'sdo_req'])
 
-        # Bus utilization (percent)
+        # Bus utilization (percent), always populated so displays can read it directly
         bus_util_percent: float = 0.0
 
         # Peak frames per seconds
@@ -289,7 +290,7 @@ class bus_stats:
 
         with self._lock:
             self._stats.sdo.request_time[(index, sub)] = time.time()
-        analyzer_defs.log.debug(f"SDO request idx=0x{index:04X} sub={sub} recorded for latency measurement")
+        analyzer_defs.log.debug("SDO request idx=0x%04X sub=%s recorded for latency measurement", index, sub)
 
     def update_sdo_response_time(self, index: int, sub: int):
         """! Update the SDO response message time from the deque.
@@ -304,7 +305,7 @@ class bus_stats:
             if req_ts:
                 resp_time = time.time() - req_ts
                 self._stats.sdo.response_time.append(resp_time)
-                self.log.debug(f"SDO response latency for 0x{index:04X}:{sub} = {resp_time:.4f}s")
+                self.log.debug("SDO response latency for 0x%04X:%s = %.4fs", index, sub, resp_time)
 
     def add_node(self, node_id: int):
         """! Add or refresh a communicating node.
@@ -324,6 +325,34 @@ class bus_stats:
         with self._lock:
             self._stats.top_talkers[cob_id] += 1
 
+    def merge(self, frame_counts: Counter, talkers: Counter, nodes: set, payload_sizes: Counter | None = None):
+        """! Merge locally batched counters under a single lock acquisition.
+        @details
+        Used by the processor to amortize locking: frame, talker, node and
+        payload updates for many frames are accumulated locally and applied
+        here in one go. Nodes are refreshed with the merge timestamp.
+        @param frame_counts Counter of @ref defs.frame_type -> frames seen.
+        @param talkers Counter of COB-ID -> frames seen.
+        @param nodes Set of node ids seen since the last merge.
+        @param payload_sizes Counter of @ref defs.frame_type -> payload bytes.
+        """
+
+        now = time.time()
+        with self._lock:
+            counts = self._stats.frame_count.counts
+            for ftype, n in frame_counts.items():
+                counts[ftype] += n
+            self._stats.frame_count.total += sum(frame_counts.values())
+            self._stats.top_talkers.update(talkers)
+            if nodes:
+                self._stats.nodes.update(nodes)
+                self._stats.node_last_seen.update(dict.fromkeys(nodes, now))
+            if payload_sizes:
+                sizes = self._stats.payload_size.sizes
+                for ftype, size in payload_sizes.items():
+                    if ftype in sizes:
+                        sizes[ftype] += size
+
     # --------- Getters ---------
     def get_frame_count(self, ftype: analyzer_defs.frame_type) -> int:
         """! Get counted frames.
@@ -90,6 +90,9 @@ def main():
     p.add_argument("--fixed", action="store_true", help="update rows instead of scrolling")
     p.add_argument("--export", default="csv", choices=["csv", "json", "pcap"], help="export received frames")
     p.add_argument("--log", action="store_true", help="enable logging")
+    p.add_argument("--sniffer-cpu", type=int, help="pin sniffer thread to this CPU (optional)")
+    p.add_argument("--processor-cpu", type=int, help="pin processor thread to this CPU (optional)")
+    p.add_argument("--rt-priority", type=int, help="SCHED_FIFO priority for sniffer/processor threads (optional, needs root)")
     args = p.parse_args()
 
     ## Enable logging if requested.
@@ -99,8 +102,8 @@ def main():
     ## Parse and load EDS mapping for object dictionary and PDOs.
     if args.eds:
         eds_map = eds_parser(args.eds)
-        analyzer_defs.log.debug(f"Decoded PDO map: {eds_map.pdo_map}")
-        analyzer_defs.log.debug(f"Decoded NAME map: {eds_map.name_map}")
+        analyzer_defs.log.debug("Decoded PDO map: %s", eds_map.pdo_map)
+        analyzer_defs.log.debug("Decoded NAME map: %s", eds_map.name_map)
 
     ## Check if user passed the desired bitrate else use default.
     if args.bitrate:
@@ -108,17 +111,22 @@ def main():
     else:
         bitrate = analyzer_defs.DEFAULT_CAN_BIT_RATE
 
-    analyzer_defs.log.info(f"Configured CAN bitrate : {bitrate}")
+    analyzer_defs.log.info("Configured CAN bitrate : %s", bitrate)
 
     ## Initialize bus statistics and reset counters.
     stats = bus_stats(bitrate=bitrate)
     stats.reset()
 
     ## Shared queue for communication between sniffer and processor threads.
-    raw_frame = queue.Queue()
+    ## @details
+    ## Frames are put from several threads (the sniffer's notifier for rx, the
+    ## sniffer thread for tx, and the main thread's stop sentinel), and no size
+    ## limit or task tracking is needed, so the unbounded, C-implemented
+    ## `SimpleQueue` with thread-safe put/get is used.
+    raw_frame = queue.SimpleQueue()
 
-    # Shared queue for processed frames
-    processed_frame = queue.Queue()
+    # Shared queue for processed frames (single producer / single display consumer)
+    processed_frame = queue.SimpleQueue()
 
     # Shared queue for requested frames
     requested_frame = queue.Queue()
@@ -127,14 +135,18 @@ def main():
     sniffer = canopen_sniffer(interface=args.interface,
                                 raw_frame=raw_frame,
                                 requested_frame=requested_frame,
-                                export=args.export)
+                                export=args.export,
+                                cpu_affinity=args.sniffer_cpu,
+                                rt_priority=args.rt_priority)
 
     ## Create frame processor thread for classification and stats update.
     processor = process_frames(stats=stats,
                                 raw_frame=raw_frame,
                                 processed_frame=processed_frame,
                                 eds_map=eds_map,
-                                export=args.export)
+                                export=args.export,
+                                cpu_affinity=args.processor_cpu,
+                                rt_priority=args.rt_priority)
 
     ## Start background threads.
     sniffer.start()
@@ -199,7 +211,7 @@ def main():
                 sniffer.bus.shutdown()
         except Exception:
             pass
-        analyzer_defs.log.info(f"Terminating {analyzer_defs.APP_NAME}...")
+        analyzer_defs.log.info("Terminating %s...", analyzer_defs.APP_NAME)
 
         # Shutdown logging now that threads have been joined\n"
         try:
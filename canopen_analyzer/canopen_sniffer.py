@@ -28,7 +28,7 @@ attach to a CANopen network object for future extensions.
 
 ### Design Notes
 - This module performs no CANopen decoding or classification.
-- Frames are passed downstream as lightweight dictionaries.
+- Frames are passed downstream as lightweight @ref analyzer_defs.can_frame tuples.
 - Network connection failures are non-fatal.
 
 ### Threading Model
@@ -41,7 +41,6 @@ during shutdown or transient failures.
 """
 
 import os
-import csv
 import json
 import time
 import struct
@@ -59,6 +58,30 @@ from scapy.data import DLT_CAN_SOCKETCAN
 
 import analyzer_defs as analyzer_defs
 
+## COB-ID column values of the raw CSV export, encoded once.
+_COB_HEX_BYTES = tuple(s.encode() for s in analyzer_defs.COB_HEX)
+
+
+class _rx_listener(can.Listener):
+    """! Hand frames received by the sniffer's `can.Notifier` to the sniffer.
+    @details
+    Runs on the notifier thread. Handler errors are logged so a bad frame
+    cannot stop reception; receive errors end the sniffer loop.
+    """
+
+    def __init__(self, sniffer):
+        ## Sniffer receiving the frames.
+        self.sniffer = sniffer
+
+    def on_message_received(self, msg: can.Message):
+        try:
+            self.sniffer.handle_received_message(msg)
+        except Exception:
+            self.sniffer.log.exception("Exception while handling message")
+
+    def on_error(self, exc: Exception):
+        self.sniffer._on_receive_error(exc)
+
 class canopen_sniffer(threading.Thread):
     """! CANopen bus sniffer thread.
     @details
@@ -68,21 +91,24 @@ class canopen_sniffer(threading.Thread):
     shutdown via `stop()`. Logging is performed on a per-instance logger.
     """
 
-    def __init__(self, interface: str, raw_frame: queue.Queue = None, requested_frame=None, export: str | None = None):
+    def __init__(self, interface: str, raw_frame: queue.SimpleQueue = None, requested_frame=None, export: str | None = None,
+                 cpu_affinity: int | None = None, rt_priority: int | None = None):
         """! Initialize CAN sniffer thread and open resources.
         @details
         The constructor opens the socketcan Bus and attempts to connect a
         CANopen Network (non-fatal). If export is enabled, the export file
         and writer are created and a header row is persisted.
         @param interface CAN interface name as string (e.g., "can0" or "vcan0").
-        @param raw_frame `queue.Queue` instance to push received frames for processing.
+        @param raw_frame `queue.SimpleQueue` (or `queue.Queue`) instance to push received frames for processing.
         @param export `csv`, `json`, `pcap`: enable export of raw frames to a file.
+        @param cpu_affinity CPU index to pin the sniffer thread to (optional).
+        @param rt_priority SCHED_FIFO priority for the sniffer thread (optional, needs root).
         """
 
         super().__init__(daemon=True)
 
         ## Queue used to push raw frames for downstream processing.
-        self.raw_frame = raw_frame or queue.Queue()
+        self.raw_frame = raw_frame if raw_frame is not None else queue.SimpleQueue()
 
         ## Queue used to receive frames for sending over CAN bus.
         self.requested_frame = requested_frame or queue.Queue()
@@ -96,6 +122,12 @@ class canopen_sniffer(threading.Thread):
         ## CAN interface name used by the sniffer.
         self.interface = interface
 
+        ## CPU the thread is pinned to on start (None keeps the default).
+        self.cpu_affinity = cpu_affinity
+
+        ## SCHED_FIFO priority applied on start (None keeps the default).
+        self.rt_priority = rt_priority
+
         ## Flag indicating whether export is enabled.
         self.export = export  # None | csv | json | pcap
 
@@ -106,26 +138,43 @@ class canopen_sniffer(threading.Thread):
         self.export_file = None
 
         ## Writer instance used to write exported data (or None).
+        ## @details
+        ## Unused for CSV, which writes pre-encoded rows directly to `export_file`.
         self.export_writer = None
 
         ## Export serial number (incremented for each exported row).
         self.export_serial_number = 1
 
+        ## Pending encoded CSV rows, written in one `os.write` by @ref _flush_export_buffer.
+        self._export_buffer = bytearray()
+
+        ## Raw frames (@ref analyzer_defs.can_frame) handed from the receive loop to @ref _export_writer_loop.
+        self._export_queue = None
+
+        ## Background thread persisting raw CSV rows (None unless CSV export is enabled).
+        self._export_thread = None
+
+        ## Number of raw CSV rows dropped because the export queue was full.
+        self._export_dropped = 0
+
         if self.export == "csv":
             try:
                 self.export_filename = f"{analyzer_defs.APP_NAME}_raw.csv"
-                self.export_file = open(self.export_filename, "w", newline="")
-                self.export_writer = csv.writer(self.export_file)
-                self.export_writer.writerow(
-                    ["S.No.", "Time", "Type", "COB-ID", "Error", "Raw"]
-                )
+                # Unbuffered binary mode: rows are ASCII-only, pre-encoded and
+                # coalesced in `_export_buffer` before hitting the file descriptor.
+                self.export_file = open(self.export_filename, "wb", buffering=0)
+                self.export_file.write(b"S.No.,Time,Type,COB-ID,Error,Raw\r\n")
                 # persist header
                 try:
                     self.export_file.flush()
                     os.fsync(self.export_file.fileno())
                 except Exception:
                     pass
-                self.log.info(f"CSV export enabled → {self.export_filename}")
+                self._export_queue = queue.Queue(maxsize=analyzer_defs.EXPORT_QUEUE_SIZE)
+                self._export_thread = threading.Thread(target=self._export_writer_loop,
+                                                       name=f"{self.__class__.__name__}-export",
+                                                       daemon=True)
+                self.log.info("CSV export enabled → %s", self.export_filename)
             except Exception as e:
                 self.log.exception("Failed to open CSV export file: %s", e)
                 self.export = False
@@ -133,14 +182,14 @@ class canopen_sniffer(threading.Thread):
         elif self.export == "json":
             try:
                 self.export_filename = f"{analyzer_defs.APP_NAME}_raw.json"
-                self.export_file = open(self.export_filename, "w")
+                self.export_file = open(self.export_filename, "w", buffering=analyzer_defs.EXPORT_FILE_BUFFERING)
 
                 # JSON array start
                 self.export_file.write("[\n")
                 ## Identifier for first element of JSON file.
                 self._json_first = True
 
-                self.log.info(f"JSON export enabled → {self.export_filename}")
+                self.log.info("JSON export enabled → %s", self.export_filename)
             except Exception as e:
                 self.log.exception("Failed to open JSON export file: %s", e)
                 self.export = False
@@ -164,26 +213,37 @@ class canopen_sniffer(threading.Thread):
         try:
             ## CAN bus instance with configuration loading.
             self.bus = can.interface.Bus(channel=interface, interface="socketcan")
-            self.log.info(f"CAN socket opened on {interface}")
+            self.log.info("CAN socket opened on %s", interface)
         except Exception as e:
             self.log.exception("Failed to open CAN interface %s: %s", interface, e)
             raise
 
+        ## Notifier thread receiving from `bus` and handling frames (created in @ref run).
+        self._notifier = None
+
+        ## Serializes JSON/PCAP export between the receive and the send path.
+        self._export_lock = threading.Lock()
+
         ## Optional CANopen.Network instance (connected if possible).
         self.network = canopen.Network()
         try:
             self.network.connect(channel=interface, interface="socketcan")
-            self.log.info(f"Connected Network on {interface}")
+            self.log.info("Connected Network on %s", interface)
         except Exception:
             self.log.warning("Network connection failed (not critical)")
 
-    def _json_safe_raw_frame(self, frame: dict) -> dict:
+    def _json_safe_raw_frame(self, frame: analyzer_defs.can_frame) -> dict:
+        """! Create a raw frame record for saving to JSON.
+        @param frame @ref analyzer_defs.can_frame to be converted.
+        @return dict JSON-serializable view of the frame.
+        """
+
         return {
-            "time": analyzer_defs.now_str(),
-            "type": frame["type"],
-            "cob": frame["cob"],
-            "error": frame["error"],
-            "raw": analyzer_defs.bytes_to_hex(frame["raw"]),
+            "time": analyzer_defs.time_str(frame.time),
+            "type": frame.type,
+            "cob": frame.cob,
+            "error": frame.error,
+            "raw": analyzer_defs.bytes_to_hex(frame.raw),
         }
 
     def _ensure_bus(self):
@@ -192,16 +252,19 @@ class canopen_sniffer(threading.Thread):
         if not getattr(self, "bus", None):
             raise RuntimeError("CAN bus not initialized")
 
-    def _handle_requested_frame(self):
-        """! Dispatch queued control commands from UI layers."""
+    def _on_receive_error(self, exc: Exception):
+        """! Handle the error that ended the notifier's receive thread.
+        @details
+        Typically the socket was closed during shutdown. The run loop is woken
+        with a `None` request so the sniffer exits.
+        @param exc Exception raised by `bus.recv()`.
+        """
 
-        try:
-            while True:
-                req = self.requested_frame.get_nowait()
-                self._dispatch_request(req)
-                self.requested_frame.task_done()
-        except queue.Empty:
-            pass
+        if self._stop_event.is_set():
+            self.log.debug("CAN receive stopped during shutdown: %s", exc)
+        else:
+            self.log.error("CAN operation error (recv): %s", exc)
+        self.requested_frame.put(None)
 
     def _dispatch_request(self, req: dict):
         """! Send request frame on CAN bus."""
@@ -233,14 +296,90 @@ class canopen_sniffer(threading.Thread):
         else:
             self.log.warning("Unknown request type: %s", rtype)
 
+    def _flush_export_buffer(self):
+        """! Write pending CSV rows to the export file with a single syscall."""
+
+        buf = self._export_buffer
+        if not buf:
+            return
+        fd = self.export_file.fileno()
+        while buf:
+            written = os.write(fd, buf)
+            del buf[:written]
+
+    def _export_writer_loop(self):
+        """! Persist queued raw CSV rows on a dedicated thread.
+        @details
+        Drains rows queued by @ref export_raw_frame in batches, encodes them
+        into `_export_buffer` and writes them out when the buffer is full, on
+        every `defs.FSYNC_EVERY` rows (followed by `fsync`) and whenever the
+        queue runs empty. Returns on the `None` sentinel queued by @ref run
+        on shutdown.
+
+        Failures are handled per row: the sentinel is checked before any
+        formatting or I/O, so a failing write (ENOSPC, EIO) can never swallow
+        it and keep the thread alive, and rows that could not be written are
+        discarded instead of accumulating in `_export_buffer`.
+        """
+
+        q = self._export_queue
+        while True:
+            rows = analyzer_defs.drain_queue(q, analyzer_defs.QUEUE_DRAIN_BATCH)
+            if not rows:
+                rows = [q.get()]
+                q.task_done()
+
+            for row in rows:
+                if row is None:
+                    return
+
+                try:
+                    ts, ftype, cob, error, raw = row
+                    self._export_buffer += b"%d,%s,%s,%s,%s,%s\r\n" % (
+                        self.export_serial_number,
+                        analyzer_defs.time_str(ts).encode(),
+                        ftype.encode(),
+                        _COB_HEX_BYTES[cob] if cob < 0x800 else b"0x%03X" % cob,
+                        str(error).encode(),
+                        # raw is the bytearray from can.Message, hex it directly in C
+                        raw.hex(" ").upper().encode(),
+                    )
+                    self.export_serial_number += 1
+                    # write out and fsync periodically
+                    if (self.export_serial_number % analyzer_defs.FSYNC_EVERY) == 0:
+                        self._flush_export_buffer()
+                        os.fsync(self.export_file.fileno())
+                    elif len(self._export_buffer) >= analyzer_defs.EXPORT_BUFFER_SIZE:
+                        self._flush_export_buffer()
+                except Exception as e:
+                    self._discard_export_buffer(e)
+
+            # nothing else pending: hand the rows to the OS
+            if q.empty():
+                try:
+                    self._flush_export_buffer()
+                except Exception as e:
+                    self._discard_export_buffer(e)
+
+    def _discard_export_buffer(self, error: Exception):
+        """! Log a failed CSV export write and drop the rows still pending.
+        @details
+        Keeps `_export_buffer` bounded while the export file is unwritable
+        (e.g. disk full); the rows that could not be persisted are lost.
+        @param error The exception raised by the failed write.
+        """
+
+        self.log.error("CSV export failed: %s", error)
+        self._export_buffer.clear()
+
     # --- File export helper ---
-    def export_raw_frame(self, frame: dict, msg: can.Message | None = None):
+    def export_raw_frame(self, frame: analyzer_defs.can_frame, msg: can.Message | None = None):
         """! Save a received CAN frame (raw view) to an export file.
         @details
         Writes a single row with a serial number, timestamp, COB-ID,
-        error flag and raw payload. Periodically flushes and fsyncs the file
-        according to `defs.FSYNC_EVERY`.
-        @param frame Frame to be exported.
+        error flag and raw payload. CSV rows are only queued here and written
+        by @ref _export_writer_loop, so disk latency never stalls reception.
+        @param frame @ref analyzer_defs.can_frame to be exported.
         @param msg CANopen message to be exported.
         @return None.
         """
@@ -249,83 +388,78 @@ class canopen_sniffer(threading.Thread):
             return
 
         if self.export == "csv":
+            # timestamp and row formatting plus disk I/O happen on the export writer thread
             try:
-                self.export_writer.writerow([
-                    self.export_serial_number,
-                    analyzer_defs.now_str(),
-                    frame["type"],
-                    f"0x{frame['cob']:03X}",
-                    frame["error"],
-                    analyzer_defs.bytes_to_hex(frame["raw"]),
-                ])
-                self.export_serial_number += 1
-                # flush and fsync periodically
-                try:
-                    self.export_file.flush()
-                    if (self.export_serial_number % analyzer_defs.FSYNC_EVERY) == 0:
-                        os.fsync(self.export_file.fileno())
-                except Exception:
-                    pass
-            except Exception as e:
-                self.log.error("CSV export failed: %s", e)
-
-        elif self.export == "json":
-            try:
-                obj = self._json_safe_raw_frame(frame)
-
-                if not self._json_first:
-                    self.export_file.write(",\n")
-                self._json_first = False
-
-                json.dump(obj, self.export_file, indent=2, ensure_ascii=False)
+                self._export_queue.put_nowait(frame)
+            except queue.Full:
+                self._export_dropped += 1
+            return
 
+        # JSON/PCAP writers are shared by the receive (notifier) and the send path
+        with self._export_lock:
+            if self.export == "json":
                 try:
-                    self.export_file.flush()
-                except Exception:
-                    pass
-
-            except Exception as e:
-                self.log.error("JSON export failed: %s", e)
+                    obj = self._json_safe_raw_frame(frame)
+
+                    # one buffered write per object (json.dump writes every token separately)
+                    text = json.dumps(obj, indent=2, ensure_ascii=False)
+                    if self._json_first:
+                        self._json_first = False
+                        self.export_file.write(text)
+                    else:
+                        self.export_file.write(",\n" + text)
+                    self.export_serial_number += 1
+
+                    # write out and fsync periodically
+                    try:
+                        if (self.export_serial_number % analyzer_defs.FSYNC_EVERY) == 0:
+                            self.export_file.flush()
+                            os.fsync(self.export_file.fileno())
+                    except Exception:
+                        pass
 
-        elif self.export == "pcap" and msg is not None and self.pcap_writer:
-            try:
-                # --- CAN ID (29-bit, then flags) ---
-                can_id = msg.arbitration_id & 0x1FFFFFFF
-
-                if msg.is_extended_id:
-                    can_id |= 0x80000000  # CAN_EFF_FLAG
-                if msg.is_remote_frame:
-                    can_id |= 0x40000000  # CAN_RTR_FLAG
-
-                # IMPORTANT:
-                # CANopen EMCY is NOT a SocketCAN error frame
-                if msg.is_error_frame and msg.arbitration_id == 0:
-                    can_id |= 0x20000000  # CAN_ERR_FLAG
-
-                # --- DLC must be actual data length ---
-                data = bytes(msg.data)
-                can_dlc = len(data)
-                data = data.ljust(8, b"\x00")
-
-                # --- MUST be network (big-endian) ---
-                frame = struct.pack(
-                    "!IB3x8s",
-                    can_id,
-                    can_dlc,
-                    data
-                )
+                except Exception as e:
+                    self.log.error("JSON export failed: %s", e)
 
-                self.pcap_writer.write(frame)
+            elif self.export == "pcap" and msg is not None and self.pcap_writer:
+                try:
+                    # --- CAN ID (29-bit, then flags) ---
+                    can_id = msg.arbitration_id & 0x1FFFFFFF
+
+                    if msg.is_extended_id:
+                        can_id |= 0x80000000  # CAN_EFF_FLAG
+                    if msg.is_remote_frame:
+                        can_id |= 0x40000000  # CAN_RTR_FLAG
+
+                    # IMPORTANT:
+                    # CANopen EMCY is NOT a SocketCAN error frame
+                    if msg.is_error_frame and msg.arbitration_id == 0:
+                        can_id |= 0x20000000  # CAN_ERR_FLAG
+
+                    # --- DLC must be actual data length ---
+                    data = bytes(msg.data)
+                    can_dlc = len(data)
+                    data = data.ljust(8, b"\x00")
+
+                    # --- MUST be network (big-endian) ---
+                    frame = struct.pack(
+                        "!IB3x8s",
+                        can_id,
+                        can_dlc,
+                        data
+                    )
+
+                    self.pcap_writer.write(frame)
 
-            except Exception as e:
-                self.log.error("PCAP export failed: %s", e)
+                except Exception as e:
+                    self.log.error("PCAP export failed: %s", e)
 
     # --- Message handling ---
     def handle_received_message(self, msg: can.Message):
         """! Handle a received CAN message.
         @details
-        Extracts arbitration id, raw payload and error flag, builds a small
-        frame dictionary containing a timestamp and pushes it to `raw_frame`.
+        Extracts arbitration id, raw payload and error flag, builds an
+        @ref analyzer_defs.can_frame with a timestamp and pushes it to `raw_frame`.
         Also logs the raw frame and triggers export if enabled.
         @param msg The `can.Message` instance received from the bus.
         """
@@ -335,12 +469,15 @@ class canopen_sniffer(threading.Thread):
         raw = msg.data
         error = msg.is_error_frame
 
-        frame = {"time": time.time(), "type": "rx", "cob": cob, "error": error, "raw": raw}
+        frame = analyzer_defs.can_frame(time.time(), "rx", cob, error, raw)
         # Push frame to queue and export if enabled.
         self.raw_frame.put(frame)
-        self.export_raw_frame(frame, msg)
+        if self.export:
+            self.export_raw_frame(frame, msg)
 
-        self.log.debug(f"Rx Raw frame: [{analyzer_defs.now_str()}] [0x{cob:03X}] [{error}] [{analyzer_defs.bytes_to_hex(raw)}]")
+        # Skip hex/timestamp formatting when no debug log is written
+        if analyzer_defs.is_debug_enabled(self.log):
+            self.log.debug("Rx Raw frame: [%s] [0x%03X] [%s] [%s]", analyzer_defs.time_str(frame.time), cob, error, analyzer_defs.bytes_to_hex(raw))
 
     # --- SDO Download (Expedited Write) ---
     def send_sdo_download(self, node_id: int, index: int, subindex: int, value: int, size: int):
@@ -379,12 +516,13 @@ class canopen_sniffer(threading.Thread):
         )
 
         self.bus.send(msg)
-        frame = {"time": analyzer_defs.now_str(), "type": "tx", "cob": cob_id, "error": "", "raw": msg.data}
+        frame = analyzer_defs.can_frame(time.time(), "tx", cob_id, "", msg.data)
         # Push frame to queue and export if enabled.
         self.raw_frame.put(frame)
         self.export_raw_frame(frame, msg)
 
-        self.log.debug("SDO-Download Tx Raw frame: [%s] [0x%03X] [%s] [%s]", analyzer_defs.now_str(), cob_id, "", analyzer_defs.bytes_to_hex(bytes(payload)))
+        if analyzer_defs.is_debug_enabled(self.log):
+            self.log.debug("SDO-Download Tx Raw frame: [%s] [0x%03X] [%s] [%s]", analyzer_defs.time_str(frame.time), cob_id, "", analyzer_defs.bytes_to_hex(payload))
 
     # --- SDO Upload Request (Read) ---
     def send_sdo_upload_request(self, node_id: int, index: int, subindex: int):
@@ -413,12 +551,13 @@ class canopen_sniffer(threading.Thread):
         )
         self.bus.send(msg)
 
-        frame = {"time": analyzer_defs.now_str(), "type": "tx", "cob": cob_id, "error": "", "raw": msg.data}
+        frame = analyzer_defs.can_frame(time.time(), "tx", cob_id, "", msg.data)
         # Push frame to queue and export if enabled.
         self.raw_frame.put(frame)
         self.export_raw_frame(frame, msg)
 
-        self.log.debug("SDO-Upload Tx Raw frame: [%s] [0x%03X] [%s] [%s]", analyzer_defs.now_str(), cob_id, "", analyzer_defs.bytes_to_hex(bytes(payload)))
+        if analyzer_defs.is_debug_enabled(self.log):
+            self.log.debug("SDO-Upload Tx Raw frame: [%s] [0x%03X] [%s] [%s]", analyzer_defs.time_str(frame.time), cob_id, "", analyzer_defs.bytes_to_hex(payload))
 
     # --- Raw PDO Send ---
     def send_raw_pdo(self, cob_id: int, data: bytes):
@@ -441,31 +580,44 @@ class canopen_sniffer(threading.Thread):
         )
         self.bus.send(msg)
 
-        frame = {"time": analyzer_defs.now_str(), "type": "tx", "cob": cob_id, "error": "", "raw": msg.data}
+        frame = analyzer_defs.can_frame(time.time(), "tx", cob_id, "", msg.data)
         # Push frame to queue and export if enabled.
         self.raw_frame.put(frame)
         self.export_raw_frame(frame, msg)
 
-        self.log.debug("PDO Tx Raw frame: [%s] [0x%03X] [%s] [%s]", analyzer_defs.now_str(), cob_id, "", analyzer_defs.bytes_to_hex(bytes(data)))
+        if analyzer_defs.is_debug_enabled(self.log):
+            self.log.debug("PDO Tx Raw frame: [%s] [0x%03X] [%s] [%s]", analyzer_defs.time_str(frame.time), cob_id, "", analyzer_defs.bytes_to_hex(data))
 
     def run(self):
         """! Main loop of the sniffer thread.
 
         @details
-        Continuously receives frames from the CAN bus using a short timeout,
-        handles interrupt-like exceptions gracefully, and delegates message
-        processing to `handle_received_message`. On exit, export file and bus resources
-        are closed/shutdown cleanly.
+        Starts a `can.Notifier` whose thread blocks in `bus.recv()` and hands
+        every received frame straight to `handle_received_message`. The sniffer
+        thread itself sleeps on `requested_frame` and only wakes to send queued
+        requests; `stop()` or a receive error wake it with a `None` request.
+        On an idle bus only the notifier's receive thread wakes, once every
+        `analyzer_defs.RECV_TIMEOUT`, so it can notice `stop()`. On exit,
+        export file and bus resources are closed/shutdown cleanly.
         """
         self.log.info("Sniffer thread started (interface=%s)", self.interface)
-        recv_timeout = 0.1
+        analyzer_defs.apply_thread_scheduling(self.log, self.cpu_affinity, self.rt_priority)
+        if self._export_thread is not None:
+            self._export_thread.start()
 
         try:
+            # Created here so the receive thread inherits this thread's CPU affinity and priority
+            self._notifier = can.Notifier(self.bus, [_rx_listener(self)], timeout=analyzer_defs.RECV_TIMEOUT)
+
             while not self._stop_event.is_set():
+                # Sleep until a UI request arrives
+                req = self.requested_frame.get()
+                self.requested_frame.task_done()
+                if req is None:
+                    break
 
-                # Handle outgoing requests (NEW)
                 try:
-                    self._handle_requested_frame()
+                    self._dispatch_request(req)
                 except can_exceptions.CanOperationError as e:
                     # Happens when the underlying socket is closed during shutdown.
                     # If we are stopping, treat silently; otherwise warn and break.
@@ -473,54 +625,34 @@ class canopen_sniffer(threading.Thread):
                         self.log.warning("CanOperationError during shutdown: %s", e)
                         break
                     self.log.error("CAN operation error (send): %s", e)
-
-                # Handle incoming CAN frames
-                try:
-                    msg = self.bus.recv(timeout=recv_timeout)
-                except (InterruptedError, KeyboardInterrupt):
-                    # signal interruption — re-check stop flag and continue/exit
-                    if self._stop_event.is_set():
-                        break
-                    continue
-                except can_exceptions.CanOperationError as e:
-                    # Happens when the underlying socket is closed during shutdown.
-                    # If we are stopping, treat silently; otherwise warn and break.
-                    if self._stop_event.is_set():
-                        self.log.warning("CanOperationError during shutdown: %s", e)
-                        break
-                    self.log.error("CAN operation error (recv): %s", e)
-                    break
-                except OSError as e:
-                    # OSError like "Bad file descriptor" can also occur when socket is closed.
-                    if self._stop_event.is_set():
-                        self.log.debug("OSError during shutdown: %s", e)
-                        break
-                    self.log.warning("OSError from CAN recv: %s", e)
-                    # short sleep but wake on stop
-                    if self._stop_event.wait(0.2):
-                        break
-                    continue
-                except Exception as e:
-                    # Unexpected error — log at debug level and backoff to avoid tight loop.
-                    # Do not log full traceback when shutdown is in progress to avoid noisy output.
-                    if self._stop_event.is_set():
-                        self.log.debug("Unexpected exception during shutdown: %s", e)
-                        break
-                    self.log.exception("Unexpected error in CAN recv")
-                    if self._stop_event.wait(0.2):
-                        break
-                    continue
-
-                # Received message, handle it
-                if msg:
-                    try:
-                        self.handle_received_message(msg)
-                    except Exception:
-                        self.log.exception("Exception while handling message")
+                except Exception:
+                    self.log.exception("Failed to send requested frame: %s", req)
 
         finally:
+            # stop receiving before the exports and the bus go away
+            try:
+                if self._notifier is not None:
+                    self._notifier.stop()
+            except Exception:
+                pass
+
             # Always attempt to flush/close export (if any) and shutdown resources safely.
             try:
+                # Let the CSV writer thread persist everything queued so far, but never
+                # wait forever on a writer stuck in I/O
+                writer_alive = False
+                if self._export_thread is not None and self._export_thread.is_alive():
+                    try:
+                        self._export_queue.put(None, timeout=2.0)
+                    except queue.Full:
+                        pass
+                    self._export_thread.join(timeout=2.0)
+                    writer_alive = self._export_thread.is_alive()
+                    if writer_alive:
+                        self.log.warning("CSV export writer did not stop; pending rows are not flushed")
+                if self._export_dropped:
+                    self.log.warning("Dropped %d raw CSV rows (export queue full)", self._export_dropped)
+
                 export_file = getattr(self, "export_file", None)
 
                 if export_file:
@@ -533,6 +665,8 @@ class canopen_sniffer(threading.Thread):
 
                     # Best-effort flush + fsync for file-based exports
                     try:
+                        if self.export == "csv" and not writer_alive:
+                            self._flush_export_buffer()
                         export_file.flush()
                         os.fsync(export_file.fileno())
                     except Exception:
@@ -575,13 +709,22 @@ class canopen_sniffer(threading.Thread):
     def stop(self, shutdown_bus: bool = True):
         """! Request the sniffer thread to stop and optionally shutdown the bus.
         @details
-        Signals the run loop to exit via the internal `_stop_event` and attempts
-        to shutdown the underlying CAN bus if requested.
+        Signals the run loop to exit via the internal `_stop_event`, wakes it
+        with a `None` request and attempts to shutdown the underlying CAN bus
+        if requested.
         @param shutdown_bus If True, call `bus.shutdown()` when stopping.
         """
         self._stop_event.set()
+        # Wake the blocking get() in run()
+        self.requested_frame.put(None)
         self.log.debug("Stop requested for sniffer thread")
         if shutdown_bus:
+            # let the notifier thread leave recv() before its socket is closed
+            try:
+                if self._notifier is not None:
+                    self._notifier.stop()
+            except Exception as e:
+                self.log.debug("notifier.stop() raised during stop(): %s", e)
             try:
                 if getattr(self, "bus", None) is not None:
                     # bus.shutdown() may raise "Bad file descriptor" if socket already closed;
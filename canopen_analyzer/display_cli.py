@@ -37,6 +37,7 @@ Display rendering errors are handled gracefully to avoid terminating the UI.
 
 import time
 import logging
+import operator
 
 import sys
 import termios
@@ -57,6 +58,72 @@ from rich import box
 from bus_stats import bus_stats
 import analyzer_defs as analyzer_defs
 
+## Sparkline glyphs, lowest to highest.
+_SPARK_BLOCKS = "▁▂▃▄▅▆▇█"
+
+## Highest valid index into @ref _SPARK_BLOCKS.
+_SPARK_TOP = len(_SPARK_BLOCKS) - 1
+
+
+## Metric labels shown in the Bus Stats table.
+_METRIC_LABELS = (
+    "State", "Active Nodes", "PDO Frames/s", "SDO Frames/s",
+    "HB Frames/s", "EMCY Frames/s", "Total Frames/s", "Peak Frames/s",
+    "Bus Util %", "Bus Idle %", "SDO OK/Abort",
+    "SDO resp time", "Last Error Frame", "Top Talkers", "Frame Dist."
+)
+
+## Width of the Bus Stats Metric column (max label length + padding).
+_METRIC_COL_WIDTH = max(len(label) for label in _METRIC_LABELS) + 2
+
+## Width of the Name column in the PDO/SDO tables.
+_NAME_COL_WIDTH = 20
+
+## Width of the Decoded column in the PDO/SDO tables.
+_DECODED_COL_WIDTH = 15
+
+## Filler row padding the Protocol table to its fixed height (shared, never mutated).
+_EMPTY_PROTO_ROW = {"time": "", "cob": "", "type": "", "raw": "", "decoded": "", "count": ""}
+
+## Filler row padding the PDO/SDO tables to their fixed height (shared, never mutated).
+_EMPTY_DATA_ROW = {"time": "", "cob": "", "dir": "", "name": "", "index": "", "sub": "", "raw": "", "decoded": "", "count": ""}
+
+## Protocol table column specs: (header, Table.add_column kwargs).
+_PROTO_COLUMNS = (
+    ("Time", {"no_wrap": True}),
+    ("COB-ID", {"width": 8}),
+    ("Type", {"width": 12}),
+    ("Raw Data", {"no_wrap": True}),
+    ("Decoded", {}),
+    ("Count", {"width": 6, "justify": "right"}),
+)
+
+## PDO table column specs: (header, Table.add_column kwargs).
+_PDO_COLUMNS = (
+    ("Time", {"no_wrap": True}),
+    ("COB-ID", {"width": 8}),
+    ("Dir", {"width": 4}),
+    ("Name", {"width": _NAME_COL_WIDTH}),
+    ("Index", {}),
+    ("Sub", {}),
+    ("Raw Data", {"no_wrap": True}),
+    ("Decoded", {"width": _DECODED_COL_WIDTH}),
+    ("Count", {"width": 6, "justify": "right"}),
+)
+
+## SDO table column specs: (header, Table.add_column kwargs).
+_SDO_COLUMNS = (
+    ("Time", {"no_wrap": True}),
+    ("COB-ID", {"width": 8}),
+    ("Dir", {"width": 6}),
+    ("Name", {"width": _NAME_COL_WIDTH}),
+    ("Index", {}),
+    ("Sub", {}),
+    ("Raw Data", {"no_wrap": True}),
+    ("Decoded", {"width": _DECODED_COL_WIDTH}),
+    ("Count", {"width": 6, "justify": "right"}),
+)
+
 class display_cli(threading.Thread):
     """! Rich-based CLI display thread that consumes processed_frame queue and renders
     Protocol, PDO, SDO tables plus Bus Stats in a live layout.
@@ -65,7 +132,7 @@ class display_cli(threading.Thread):
     rate calculation or use bitrate directly.
     """
 
-    def __init__(self, stats: bus_stats, processed_frame: queue.Queue, requested_frame=None, fixed: bool = False):
+    def __init__(self, stats: bus_stats, processed_frame: queue.SimpleQueue, requested_frame=None, fixed: bool = False):
         """! Initialize CLI based CANopen display.
         @details
         This thread initializes and launches the CLI application that renders
@@ -119,6 +186,13 @@ class display_cli(threading.Thread):
         ## SDO data dict keys -> rows mapping for fixed mode
         self.fixed_sdo = {}
 
+        ## Display bucket -> (fixed mode rows, scrolling rows)
+        self._buckets = {
+            "proto": (self.fixed_proto, self.proto_frames),
+            "pdo": (self.fixed_pdo, self.pdo_frames),
+            "sdo": (self.fixed_sdo, self.sdo_frames),
+        }
+
         ## Remote node control command history
         self.remote_cmd_history = deque(maxlen=analyzer_defs.MAX_CLI_CMD_HISTORY)
 
@@ -141,18 +215,11 @@ class display_cli(threading.Thread):
             seq = list(history)[-analyzer_defs.STATS_GRAPH_WIDTH:]
             if not seq:
                 return ""
-            blocks = "▁▂▃▄▅▆▇█"
             mn, mx = min(seq), max(seq)
-            span = mx - mn or 1.0
-            chars = []
-            for v in seq:
-                try:
-                    idx = int((float(v) - mn) / span * (len(blocks) - 1))
-                except Exception:
-                    idx = 0
-                idx = max(0, min(idx, len(blocks) - 1))
-                chars.append(blocks[idx])
-            return Text("".join(chars), style=style)
+            # (v - mn) * scale stays within [0, top] since mn <= v <= mx
+            scale = _SPARK_TOP / (mx - mn or 1.0)
+            blocks = _SPARK_BLOCKS
+            return Text("".join([blocks[int((v - mn) * scale)] for v in seq]), style=style)
         except Exception:
             return ""
 
@@ -174,50 +241,45 @@ class display_cli(threading.Thread):
 
         snapshot = self.stats.get_snapshot()
 
-        metric_labels = [
-            "State", "Active Nodes", "PDO Frames/s", "SDO Frames/s",
-            "HB Frames/s", "EMCY Frames/s", "Total Frames/s", "Peak Frames/s",
-            "Bus Util %", "Bus Idle %", "SDO OK/Abort",
-            "SDO resp time", "Last Error Frame", "Top Talkers", "Frame Dist."
-        ]
-        # Max label length + padding
-        metric_col_width = max(len(label) for label in metric_labels) + 2
-        graph_col_width = analyzer_defs.STATS_GRAPH_WIDTH
-
         # Build table: Metric & Graph fixed width, Value expands
         t = Table(title="Bus Stats", expand=True, box=box.SQUARE, style="yellow")
-        t.add_column("Metric", no_wrap=True, width=metric_col_width)
+        t.add_column("Metric", no_wrap=True, width=_METRIC_COL_WIDTH)
         t.add_column("Value", justify="right", ratio=1)  # fill remaining width
-        t.add_column("Graph", justify="left", width=graph_col_width)
+        t.add_column("Graph", justify="left", width=analyzer_defs.STATS_GRAPH_WIDTH)
 
         # Basic fields
         total_frames = getattr(snapshot.frame_count, "total", 0)
         nodes = getattr(snapshot, "nodes", {}) or {}
         # Bus state (authoritative, from bus_stats)
-        bus_state = getattr(snapshot.rates, "bus_state", "Idle")
+        bus_state = snapshot.rates.bus_state
         t.add_row("State", bus_state, "")
         t.add_row("Active Nodes", str(len(nodes)), f"[dim]{sorted(nodes)}[/]" if nodes else "")
 
         # Read rates and histories from snapshot.rates (structure provided by bus_stats)
-        rates_latest = getattr(snapshot.rates, "latest", {}) if hasattr(snapshot, "rates") else {}
-        rates_hist = getattr(snapshot.rates, "history", {}) if hasattr(snapshot, "rates") else {}
+        rates_latest = snapshot.rates.latest
+        rates_hist = snapshot.rates.history
+        # normalize once so the per-metric lookups below need no type checks
+        if not isinstance(rates_latest, dict):
+            rates_latest = {}
+        if not isinstance(rates_hist, dict):
+            rates_hist = {}
 
         # PDO
-        pdo_val = float(rates_latest.get("pdo", 0.0)) if isinstance(rates_latest, dict) else 0.0
-        pdo_hist = rates_hist.get("pdo", []) if isinstance(rates_hist, dict) else []
+        pdo_val = float(rates_latest.get("pdo", 0.0))
+        pdo_hist = rates_hist.get("pdo", [])
         t.add_row("PDO Frames/s", f"{pdo_val:.1f}", self._sparkline(pdo_hist, "green") if pdo_hist else "")
 
         # SDO (request + response)
-        sdo_res = float(rates_latest.get("sdo_res", 0.0)) if isinstance(rates_latest, dict) else 0.0
-        sdo_req = float(rates_latest.get("sdo_req", 0.0)) if isinstance(rates_latest, dict) else 0.0
+        sdo_res = float(rates_latest.get("sdo_res", 0.0))
+        sdo_req = float(rates_latest.get("sdo_req", 0.0))
         sdo_val = sdo_res + sdo_req
         # build combined history (elementwise sum when lengths match)
-        sdo_hist_res = rates_hist.get("sdo_res", []) if isinstance(rates_hist, dict) else []
-        sdo_hist_req = rates_hist.get("sdo_req", []) if isinstance(rates_hist, dict) else []
+        sdo_hist_res = rates_hist.get("sdo_res", [])
+        sdo_hist_req = rates_hist.get("sdo_req", [])
         sdo_hist = []
         try:
             if sdo_hist_res and sdo_hist_req and len(sdo_hist_res) == len(sdo_hist_req):
-                sdo_hist = [a + b for a, b in zip(sdo_hist_res, sdo_hist_req)]
+                sdo_hist = list(map(operator.add, sdo_hist_res, sdo_hist_req))
             elif sdo_hist_res:
                 sdo_hist = list(sdo_hist_res)
             elif sdo_hist_req:
@@ -227,36 +289,29 @@ class display_cli(threading.Thread):
         t.add_row("SDO Frames/s", f"{sdo_val:.1f}", self._sparkline(sdo_hist, "magenta") if sdo_hist else "")
 
         # Heart beat
-        pdo_val = float(rates_latest.get("hb", 0.0)) if isinstance(rates_latest, dict) else 0.0
-        pdo_hist = rates_hist.get("hb", []) if isinstance(rates_hist, dict) else []
+        pdo_val = float(rates_latest.get("hb", 0.0))
+        pdo_hist = rates_hist.get("hb", [])
         t.add_row("HB Frames/s", f"{pdo_val:.1f}", self._sparkline(pdo_hist, "cyan") if pdo_hist else "")
 
         # Emergency Messages
-        pdo_val = float(rates_latest.get("emcy", 0.0)) if isinstance(rates_latest, dict) else 0.0
-        pdo_hist = rates_hist.get("emcy", []) if isinstance(rates_hist, dict) else []
+        pdo_val = float(rates_latest.get("emcy", 0.0))
+        pdo_hist = rates_hist.get("emcy", [])
         t.add_row("EMCY Frames/s", f"{pdo_val:.1f}", self._sparkline(pdo_hist, "cyan") if pdo_hist else "")
 
         # Total frames/s
-        total_val = float(rates_latest.get("total", 0.0)) if isinstance(rates_latest, dict) else 0.0
-        total_hist = rates_hist.get("total", []) if isinstance(rates_hist, dict) else []
+        total_val = float(rates_latest.get("total", 0.0))
+        total_hist = rates_hist.get("total", [])
         t.add_row("Total Frames/s", f"{total_val:.1f}", self._sparkline(total_hist, "yellow") if total_hist else "")
 
         # Peak frames/s
-        peak_val = float(getattr(snapshot.rates, "peak_fps", 0.0))
+        peak_val = float(snapshot.rates.peak_fps)
         t.add_row("Peak Frames/s", f"{peak_val:.1f}", "")
 
         # Bus utilization (computed by bus_stats)
-        util = None
-        if hasattr(snapshot, "rates") and hasattr(snapshot.rates, "bus_util_percent"):
-            util = snapshot.rates.bus_util_percent
-        elif hasattr(snapshot, "compute_bus_util"):
-            try:
-                util = snapshot.compute_bus_util()
-            except Exception:
-                util = None
+        util = snapshot.rates.bus_util_percent
 
         idle = max(0.0, 100.0 - util) if util is not None else 0.0
-        util_hist = rates_hist.get("total", []) if isinstance(rates_hist, dict) else []
+        util_hist = rates_hist.get("total", [])
         t.add_row("Bus Util %", f"{util:.2f}%" if util is not None else "-", self._sparkline(util_hist, "grey") if util_hist else "")
         t.add_row("Bus Idle %", f"{idle:.2f}%" if util is not None else "-", "")
 
@@ -281,19 +336,16 @@ class display_cli(threading.Thread):
         # Top talkers
         try:
             top = snapshot.top_talkers.most_common(analyzer_defs.MAX_STATS_SHOW)
-            top_str = ", ".join(f"0x{c:03X}:{cnt}" for c, cnt in top) if top else "-"
+            top_str = ", ".join(f"{analyzer_defs.cob_str(c)}:{cnt}" for c, cnt in top) if top else "-"
             t.add_row("Top Talkers", top_str, "")
         except Exception:
             t.add_row("Top Talkers", "-", "")
 
         # Frame distribution — show top-N kinds sorted by count (descending)
         try:
-            counts = snapshot.frame_count.counts  # mapping: defs.frame_type -> int
-            # build list of (name, count) and sort by count desc
-            items = sorted(((k.name, v) for k, v in counts.items()), key=lambda kv: kv[1], reverse=True)
-            # choose how many to show inline
-            shown = items[:analyzer_defs.MAX_STATS_SHOW]
-            dist_pairs = ", ".join(f"{name}:{cnt}" for name, cnt in shown)
+            # Counter: defs.frame_type -> int; partial sort of the top-N only
+            shown = snapshot.frame_count.counts.most_common(analyzer_defs.MAX_STATS_SHOW)
+            dist_pairs = ", ".join(f"{ftype.name}:{cnt}" for ftype, cnt in shown)
             if not dist_pairs:
                 dist_pairs = "-"
         except Exception:
@@ -570,21 +622,13 @@ class display_cli(threading.Thread):
     def _render_tables(self):
         """! Render tables for displaying CLI data."""
 
-        NAME_COL_WIDTH = 20
-        DECODED_COL_WIDTH = 15
-
         # Protocol Data -----------------------------------------------------
         t_proto = Table(title="Protocol Data", expand=True, box=box.SQUARE, style="cyan")
-        t_proto.add_column("Time", no_wrap=True)
-        t_proto.add_column("COB-ID", width=8)
-        t_proto.add_column("Type", width=12)
-        t_proto.add_column("Raw Data", no_wrap=True)
-        t_proto.add_column("Decoded")
-        t_proto.add_column("Count", width=6, justify="right")
+        for header, opts in _PROTO_COLUMNS:
+            t_proto.add_column(header, **opts)
 
         protos = list(self.fixed_proto.values())[-analyzer_defs.PROTOCOL_TABLE_HEIGHT:] if self.fixed else list(self.proto_frames)[-analyzer_defs.PROTOCOL_TABLE_HEIGHT:]
-        while len(protos) < analyzer_defs.PROTOCOL_TABLE_HEIGHT:
-            protos.append({"time": "", "cob": "", "type": "", "raw": "", "decoded": "", "count": ""})
+        protos.extend([_EMPTY_PROTO_ROW] * (analyzer_defs.PROTOCOL_TABLE_HEIGHT - len(protos)))
         for p in protos:
             t_proto.add_row(p["time"], p["cob"], p["type"], p["raw"], p["decoded"], str(p.get("count", "")))
 
@@ -593,22 +637,14 @@ class display_cli(threading.Thread):
 
         # PDO table -----------------------------------------------------
         t_pdo = Table(title="PDO Data", expand=True, box=box.SQUARE, style="green")
-        t_pdo.add_column("Time", no_wrap=True)
-        t_pdo.add_column("COB-ID", width=8)
-        t_pdo.add_column("Dir", width=4)
-        t_pdo.add_column("Name", width=NAME_COL_WIDTH)
-        t_pdo.add_column("Index")
-        t_pdo.add_column("Sub")
-        t_pdo.add_column("Raw Data", no_wrap=True)
-        t_pdo.add_column("Decoded", width=DECODED_COL_WIDTH)
-        t_pdo.add_column("Count", width=6, justify="right")
+        for header, opts in _PDO_COLUMNS:
+            t_pdo.add_column(header, **opts)
 
         frames = list(self.fixed_pdo.values())[-analyzer_defs.DATA_TABLE_HEIGHT:] if self.fixed else list(self.pdo_frames)[-analyzer_defs.DATA_TABLE_HEIGHT:]
-        while len(frames) < analyzer_defs.DATA_TABLE_HEIGHT:
-            frames.append({"time": "", "cob": "", "dir": "", "name": "", "index": "", "sub": "", "raw": "", "decoded": "", "count": ""})
+        frames.extend([_EMPTY_DATA_ROW] * (analyzer_defs.DATA_TABLE_HEIGHT - len(frames)))
         for f in frames:
-            name = self._trim_cell(f.get("name", ""), NAME_COL_WIDTH)
-            decoded_txt = self._trim_cell(str(f.get("decoded", "")), DECODED_COL_WIDTH)
+            name = self._trim_cell(f.get("name", ""), _NAME_COL_WIDTH)
+            decoded_txt = self._trim_cell(str(f.get("decoded", "")), _DECODED_COL_WIDTH)
 
             decoded = Text(decoded_txt, style="bold green") if decoded_txt else ""
 
@@ -620,22 +656,14 @@ class display_cli(threading.Thread):
 
         # SDO table -----------------------------------------------------
         t_sdo = Table(title="SDO Data", expand=True, box=box.SQUARE, style="magenta")
-        t_sdo.add_column("Time", no_wrap=True)
-        t_sdo.add_column("COB-ID", width=8)
-        t_sdo.add_column("Dir", width=6)
-        t_sdo.add_column("Name", width=NAME_COL_WIDTH)
-        t_sdo.add_column("Index")
-        t_sdo.add_column("Sub")
-        t_sdo.add_column("Raw Data", no_wrap=True)
-        t_sdo.add_column("Decoded", width=DECODED_COL_WIDTH)
-        t_sdo.add_column("Count", width=6, justify="right")
+        for header, opts in _SDO_COLUMNS:
+            t_sdo.add_column(header, **opts)
 
         sdos = list(self.fixed_sdo.values())[-analyzer_defs.DATA_TABLE_HEIGHT:] if self.fixed else list(self.sdo_frames)[-analyzer_defs.DATA_TABLE_HEIGHT:]
-        while len(sdos) < analyzer_defs.DATA_TABLE_HEIGHT:
-            sdos.append({"time": "", "cob": "", "dir": "", "name": "", "index": "", "sub": "", "raw": "", "decoded": "", "count": ""})
+        sdos.extend([_EMPTY_DATA_ROW] * (analyzer_defs.DATA_TABLE_HEIGHT - len(sdos)))
         for s in sdos:
-            name = self._trim_cell(s.get("name", ""), NAME_COL_WIDTH)
-            decoded_txt = self._trim_cell(str(s.get("decoded", "")), DECODED_COL_WIDTH)
+            name = self._trim_cell(s.get("name", ""), _NAME_COL_WIDTH)
+            decoded_txt = self._trim_cell(str(s.get("decoded", "")), _DECODED_COL_WIDTH)
 
             decoded = Text(decoded_txt, style="bold magenta") if decoded_txt else ""
 
@@ -707,6 +735,22 @@ class display_cli(threading.Thread):
 
         return layout
 
+    def _consume_group(self, pgroup: list):
+        """! Sort one processed frame group (all entries decoded from one batch of CAN frames) into the table buffers."""
+
+        for pframe in pgroup:
+            # row, bucket (proto/pdo/sdo) and fixed-mode key are pre-rendered by the processor
+            fixed_rows, frames = self._buckets[pframe["bucket"]]
+            row = pframe["row"]
+            if self.fixed:
+                key = pframe["key"]
+                prev = fixed_rows.get(key)
+                if prev:
+                    row["count"] = prev.get("count", 1) + 1
+                fixed_rows[key] = row
+            else:
+                frames.append(row)
+
     def run(self):
         """! Run CLI based CANopen display."""
 
@@ -719,78 +763,33 @@ class display_cli(threading.Thread):
         input_thread.start()
 
         # Use Live to update the complete dashboard
-        with Live(console=self.console, refresh_per_second=5, screen=True) as live:
+        with Live(console=self.console, refresh_per_second=analyzer_defs.CLI_REFRESH_HZ, screen=True) as live:
             try:
                 # loop until stop requested
+                render_interval = 1.0 / analyzer_defs.CLI_REFRESH_HZ
+                next_render = time.monotonic()
                 while not self._stop_event.is_set():
-                    # consume all available processed frames (non-blocking)
-                    try:
-                        while True:
-                            pframe = self.processed_frame.get_nowait()
-                            # pframe fields: time, cob (int), type (defs.frame_type), index, sub, name, raw, decoded
-                            t = pframe.get("time", analyzer_defs.now_str())
-                            cob = pframe.get("cob", 0)
-                            ftype = pframe.get("type")
-                            idx = pframe.get("index", 0)
-                            sub = pframe.get("sub", 0)
-                            name = pframe.get("name", "")
-                            raw = pframe.get("raw", "")
-                            decoded = pframe.get("decoded", "")
-                            dirc = pframe.get("dir", "")
-
-                            # Format cob/index/sub as hex strings for display
-                            cob_s = f"0x{cob:03X}" if isinstance(cob, int) else str(cob)
-                            idx_s = f"0x{idx:04X}" if isinstance(idx, int) else str(idx)
-                            sub_s = f"0x{sub:02X}" if isinstance(sub, int) else str(sub)
-
-                            # classify into proto/pdo/sdo by type
-                            type_name = ftype.name if isinstance(ftype, analyzer_defs.frame_type) else str(ftype)
-                            if ftype == analyzer_defs.frame_type.PDO:
-                                key = (cob, idx, sub)
-                                row = {"time": t, "cob": cob_s, "dir": dirc, "name": name, "index": idx_s, "sub": sub_s, "raw": raw, "decoded": decoded, "count": 1}
-                                if self.fixed:
-                                    prev = self.fixed_pdo.get(key)
-                                    if prev:
-                                        row["count"] = prev.get("count", 1) + 1
-                                    self.fixed_pdo[key] = row
-                                else:
-                                    self.pdo_frames.append(row)
-                            elif ftype in (analyzer_defs.frame_type.SDO_REQ, analyzer_defs.frame_type.SDO_RES):
-                                key = (cob, idx, sub)
-                                row = {"time": t, "cob": cob_s, "dir": dirc, "name": name, "index": idx_s, "sub": sub_s, "raw": raw, "decoded": decoded, "count": 1}
-                                if self.fixed:
-                                    prev = self.fixed_sdo.get(key)
-                                    if prev:
-                                        row["count"] = prev.get("count", 1) + 1
-                                    self.fixed_sdo[key] = row
-                                else:
-                                    self.sdo_frames.append(row)
-                            else:
-                                # protocol/other
-                                ptype = type_name
-                                row = {"time": t, "cob": cob_s, "type": ptype, "raw": raw, "decoded": decoded, "count": 1}
-                                if self.fixed:
-                                    key = (cob, ptype)
-                                    prev = self.fixed_proto.get(key)
-                                    if prev:
-                                        row["count"] = prev.get("count", 1) + 1
-                                    self.fixed_proto[key] = row
-                                else:
-                                    self.proto_frames.append(row)
-
-                            try:
-                                self.processed_frame.task_done()
-                            except Exception:
-                                pass
-                    except queue.Empty:
-                        # nothing to consume
-                        pass
-
-                    # render and push to live
-                    live.update(self._render_tables())
-
-                    # small sleep to reduce busy-loop
-                    time.sleep(0.05)
+                    # block for the next frame group, but never past the render deadline
+                    timeout = next_render - time.monotonic()
+                    if timeout > 0:
+                        try:
+                            pgroup = self.processed_frame.get(timeout=timeout)
+                            self._consume_group(pgroup)
+                        except queue.Empty:
+                            pass
+
+                    # then take whatever else is queued (bounded, non-blocking)
+                    for pgroup in analyzer_defs.drain_queue(self.processed_frame, analyzer_defs.QUEUE_DRAIN_BATCH):
+                        self._consume_group(pgroup)
+
+                    # render and push to live at a fixed cadence
+                    now = time.monotonic()
+                    if now >= next_render:
+                        live.update(self._render_tables())
+                        next_render += render_interval
+                        if next_render <= now:
+                            # fell behind (slow render); resync instead of bursting
+                            next_render = now + render_interval
 
             finally:
                 self.log.info("display_cli exiting")
@@ -65,9 +65,9 @@ class GUIUpdateWorker(QObject):
     ## Emitted when a decoded frame is available
     frame_received = Signal(dict)
 
-    def __init__(self, processed_frame: queue.Queue):
+    def __init__(self, processed_frame: queue.SimpleQueue):
         """! Initialize the worker.
-        @param processed_frame Thread-safe queue of decoded CAN frames.
+        @param processed_frame Thread-safe queue of decoded CAN frame groups (lists of frame dicts).
         """
 
         super().__init__()
@@ -83,11 +83,14 @@ class GUIUpdateWorker(QObject):
 
         while self._running:
             try:
-                frame = self.processed_frame.get(timeout=0.1)
-                self.frame_received.emit(frame)
-                self.processed_frame.task_done()
+                pgroups = [self.processed_frame.get(timeout=0.1)]
             except queue.Empty:
-                pass
+                continue
+            # then take any backlog under one lock acquisition
+            pgroups += analyzer_defs.drain_queue(self.processed_frame, analyzer_defs.QUEUE_DRAIN_BATCH)
+            for frames in pgroups:
+                for frame in frames:
+                    self.frame_received.emit(frame)
 
     def stop(self):
         """! Stop the worker."""
@@ -1785,8 +1788,8 @@ class CANopenMainWindow(QMainWindow):
         top_disp = top_all[:analyzer_defs.MIN_STATS_SHOW]
 
         if top_disp:
-            text = ", ".join(f"0x{c:03X}:{n}" for c, n in top_disp)
-            tooltip = ", ".join(f"0x{c:03X}:{n}" for c, n in top_all)
+            text = ", ".join(f"{analyzer_defs.cob_str(c)}:{n}" for c, n in top_disp)
+            tooltip = ", ".join(f"{analyzer_defs.cob_str(c)}:{n}" for c, n in top_all)
         else:
             text = "-"
             tooltip = "No talkers"
@@ -1799,11 +1802,9 @@ class CANopenMainWindow(QMainWindow):
             lbl.setText(text + " …")
 
         # Frame Distribution: show MIN_STATS_SHOW, tooltip shows MAX_STATS_SHOW
-        dist_all = sorted(
-            ((k.name, v) for k, v in snap.frame_count.counts.items()),
-            key=lambda kv: kv[1],
-            reverse=True
-        )[:analyzer_defs.MAX_STATS_SHOW]
+        dist_all = [
+            (ftype.name, cnt) for ftype, cnt in snap.frame_count.counts.most_common(analyzer_defs.MAX_STATS_SHOW)
+        ]
 
         dist_disp = dist_all[:analyzer_defs.MIN_STATS_SHOW]
 
@@ -2009,7 +2010,7 @@ class CANopenMainWindow(QMainWindow):
         try:
             # Extract common frame fields
             t = p.get("time")
-            cob = f"0x{p['cob']:03X}"
+            cob = p["cob_s"]
             raw = p.get("raw", "")
             dec = p.get("decoded", "")
             cnt = 1
@@ -2017,8 +2018,9 @@ class CANopenMainWindow(QMainWindow):
             ftype = p.get("type")
             name = ftype.name if hasattr(ftype, "name") else str(ftype)
 
-            # Dispatch frame based on type
-            if ftype == analyzer_defs.frame_type.PDO:
+            # Dispatch frame on the display table pre-classified by the processor
+            bucket = p["bucket"]
+            if bucket == "pdo":
                 # PDO direction derived strictly from frame type
                 dir = "TX" if p["dir"] == 'TX' else "RX"
                 key = (p["cob"], p["index"], p["sub"])
@@ -2026,14 +2028,11 @@ class CANopenMainWindow(QMainWindow):
                     self.pdo_table, self.fixed_pdo, key,
                     [
                         t, cob, dir, p.get("name"),
-                        f"0x{p['index']:04X}", f"0x{p['sub']:02X}",
+                        p["idx_s"], p["sub_s"],
                         raw, dec, cnt
                     ]
                 )
-            elif ftype in (
-                analyzer_defs.frame_type.SDO_REQ,
-                analyzer_defs.frame_type.SDO_RES
-            ):
+            elif bucket == "sdo":
                 # SDO direction derived strictly from frame type
                 dir = "REQ" if ftype == analyzer_defs.frame_type.SDO_REQ else "RESP"
 
@@ -2044,7 +2043,7 @@ class CANopenMainWindow(QMainWindow):
                     self.sdo_table, self.fixed_sdo, key,
                     [
                         t, cob, dir, p.get("name"),
-                        f"0x{p['index']:04X}", f"0x{p['sub']:02X}",
+                        p["idx_s"], p["sub_s"],
                         raw, dec, cnt
                     ]
                 )
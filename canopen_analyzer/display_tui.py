@@ -53,6 +53,7 @@ from rich.text import Text
 import copy
 import pyperclip
 import logging
+import operator
 
 import analyzer_defs as analyzer_defs
 
@@ -696,120 +697,99 @@ class display_tui:
                     return
                 got_any = False
                 while True:
-                    try:
-                        pframe = q.get_nowait()
-                    except Exception:
+                    # take everything queued under one lock acquisition (no per-item task_done)
+                    pgroups = analyzer_defs.drain_queue(q, analyzer_defs.QUEUE_DRAIN_BATCH)
+                    if not pgroups:
                         break
                     got_any = True
-                    t = pframe.get("time", analyzer_defs.now_str())
-                    cob = pframe.get("cob", 0)
-                    ftype = pframe.get("type")
-                    idx = pframe.get("index", 0)
-                    sub = pframe.get("sub", 0)
-                    name = pframe.get("name", "")
-                    raw = pframe.get("raw", "")
-                    decoded = pframe.get("decoded", "")
-                    dirc = pframe.get("dir", "")
-
-                    cob_s = f"0x{cob:03X}" if isinstance(cob, int) else str(cob)
-                    idx_s = f"0x{idx:04X}" if isinstance(idx, int) else str(idx)
-                    sub_s = f"0x{sub:02X}" if isinstance(sub, int) else str(sub)
-
-                    type_name = ftype.name if isinstance(ftype, analyzer_defs.frame_type) else str(ftype)
-
-                    # Consistently use cls.fixed (set by run_textual) to decide behavior.
-                    if cls.fixed:
-                        if ftype == analyzer_defs.frame_type.PDO:
-                            key = (cob, idx, sub)
-                            row = {"time": t, "cob": cob_s, "dir": dirc, "name": name, "index": idx_s, "sub": sub_s, "raw": raw, "decoded": str(decoded), "count": 1}
-                            prev = self.fixed_pdo.get(key)
-                            if prev:
-                                row["count"] = prev.get("count", 1) + 1
-                            self.fixed_pdo[key] = row
-                        elif ftype in (analyzer_defs.frame_type.SDO_REQ, analyzer_defs.frame_type.SDO_RES):
-                            key = (cob, idx, sub)
-                            row = {"time": t, "cob": cob_s, "dir": dirc, "name": name, "index": idx_s, "sub": sub_s, "raw": raw, "decoded": str(decoded), "count": 1}
-                            prev = self.fixed_sdo.get(key)
-                            if prev:
-                                row["count"] = prev.get("count", 1) + 1
-                            self.fixed_sdo[key] = row
-                        else:
-                            key = (cob, type_name)
-                            row = {"time": t, "cob": cob_s, "type": type_name, "raw": raw, "decoded": str(decoded), "count": 1}
-                            prev = self.fixed_proto.get(key)
-                            if prev:
-                                row["count"] = prev.get("count", 1) + 1
-                            self.fixed_proto[key] = row
-                    else:
-                        # scrolling mode
-                        if ftype == analyzer_defs.frame_type.PDO:
-                            row = {"time": t, "cob": cob_s, "dir": dirc, "name": name, "index": idx_s, "sub": sub_s, "raw": raw, "decoded": str(decoded), "count": 1}
-                            placed = False
-                            try:
-                                for i in range(len(self.pdo_display)):
-                                    if not self.pdo_display[i].get("time"):
-                                        self.pdo_display[i] = row
-                                        placed = True
-                                        break
-                            except Exception:
-                                placed = False
-                            if not placed:
-                                try:
-                                    self.pdo_display.pop(0)
-                                    self.pdo_display.append(row)
-                                except Exception:
+                    for pgroup in pgroups:
+                        # each queue item groups all entries decoded from one batch of CAN frames
+                        for pframe in pgroup:
+                            # display row, table bucket and fixed-mode key are pre-rendered by the processor
+                            bucket = pframe["bucket"]
+                            row = pframe["row"]
+
+                            # Consistently use cls.fixed (set by run_textual) to decide behavior.
+                            if cls.fixed:
+                                if bucket == "pdo":
+                                    key = pframe["key"]
+                                    prev = self.fixed_pdo.get(key)
+                                    if prev:
+                                        row["count"] = prev.get("count", 1) + 1
+                                    self.fixed_pdo[key] = row
+                                elif bucket == "sdo":
+                                    key = pframe["key"]
+                                    prev = self.fixed_sdo.get(key)
+                                    if prev:
+                                        row["count"] = prev.get("count", 1) + 1
+                                    self.fixed_sdo[key] = row
+                                else:
+                                    key = pframe["key"]
+                                    prev = self.fixed_proto.get(key)
+                                    if prev:
+                                        row["count"] = prev.get("count", 1) + 1
+                                    self.fixed_proto[key] = row
+                            else:
+                                # scrolling mode
+                                if bucket == "pdo":
+                                    placed = False
                                     try:
-                                        self.pdo_display[-1] = row
+                                        for i in range(len(self.pdo_display)):
+                                            if not self.pdo_display[i].get("time"):
+                                                self.pdo_display[i] = row
+                                                placed = True
+                                                break
                                     except Exception:
-                                        pass
+                                        placed = False
+                                    if not placed:
+                                        try:
+                                            self.pdo_display.pop(0)
+                                            self.pdo_display.append(row)
+                                        except Exception:
+                                            try:
+                                                self.pdo_display[-1] = row
+                                            except Exception:
+                                                pass
 
-                        elif ftype in (analyzer_defs.frame_type.SDO_REQ, analyzer_defs.frame_type.SDO_RES):
-                            row = {"time": t, "cob": cob_s, "dir": dirc, "name": name, "index": idx_s, "sub": sub_s, "raw": raw, "decoded": str(decoded), "count": 1}
-                            placed = False
-                            try:
-                                for i in range(len(self.sdo_display)):
-                                    if not self.sdo_display[i].get("time"):
-                                        self.sdo_display[i] = row
-                                        placed = True
-                                        break
-                            except Exception:
-                                placed = False
-                            if not placed:
-                                try:
-                                    self.sdo_display.pop(0)
-                                    self.sdo_display.append(row)
-                                except Exception:
+                                elif bucket == "sdo":
+                                    placed = False
                                     try:
-                                        self.sdo_display[-1] = row
+                                        for i in range(len(self.sdo_display)):
+                                            if not self.sdo_display[i].get("time"):
+                                                self.sdo_display[i] = row
+                                                placed = True
+                                                break
                                     except Exception:
-                                        pass
+                                        placed = False
+                                    if not placed:
+                                        try:
+                                            self.sdo_display.pop(0)
+                                            self.sdo_display.append(row)
+                                        except Exception:
+                                            try:
+                                                self.sdo_display[-1] = row
+                                            except Exception:
+                                                pass
 
-                        else:
-                            row = {"time": t, "cob": cob_s, "type": type_name, "raw": raw, "decoded": str(decoded), "count": 1}
-                            placed = False
-                            try:
-                                for i in range(len(self.proto_display)):
-                                    if not self.proto_display[i].get("time"):
-                                        self.proto_display[i] = row
-                                        placed = True
-                                        break
-                            except Exception:
-                                placed = False
-                            if not placed:
-                                try:
-                                    self.proto_display.pop(0)
-                                    self.proto_display.append(row)
-                                except Exception:
+                                else:
+                                    placed = False
                                     try:
-                                        self.proto_display[-1] = row
+                                        for i in range(len(self.proto_display)):
+                                            if not self.proto_display[i].get("time"):
+                                                self.proto_display[i] = row
+                                                placed = True
+                                                break
                                     except Exception:
-                                        pass
-
-
-                    try:
-                        q.task_done()
-                    except Exception:
-                        pass
+                                        placed = False
+                                    if not placed:
+                                        try:
+                                            self.proto_display.pop(0)
+                                            self.proto_display.append(row)
+                                        except Exception:
+                                            try:
+                                                self.proto_display[-1] = row
+                                            except Exception:
+                                                pass
 
                 if got_any:
                     self._refresh_tables()
@@ -1021,14 +1001,19 @@ class display_tui:
                 nodes = getattr(snapshot, "nodes", {}) or {}
 
                 # Read rates and histories from snapshot.rates (structure provided by bus_stats)
-                rates_latest = getattr(snapshot.rates, "latest", {}) if hasattr(snapshot, "rates") else {}
-                rates_hist = getattr(snapshot.rates, "history", {}) if hasattr(snapshot, "rates") else {}
+                rates_latest = snapshot.rates.latest
+                rates_hist = snapshot.rates.history
+                # normalize once so the per-metric lookups below need no type checks
+                if not isinstance(rates_latest, dict):
+                    rates_latest = {}
+                if not isinstance(rates_hist, dict):
+                    rates_hist = {}
 
                 def get_hist(key):
                     """! Helper to get stats history"""
 
                     try:
-                        return rates_hist.get(key, []) if isinstance(rates_hist, dict) else []
+                        return rates_hist.get(key, [])
                     except Exception:
                         return []
 
@@ -1086,7 +1071,7 @@ class display_tui:
                             pass
 
                 # Bus state (authoritative, from bus_stats)
-                bus_state = getattr(snapshot.rates, "bus_state", "Idle")
+                bus_state = snapshot.rates.bus_state
                 add_metric("State", bus_state)
 
                 # Active Nodes (count + node IDs)
@@ -1105,12 +1090,12 @@ class display_tui:
                 add_metric("Active Nodes", node_count, hist_key=None, data=node_ids)
 
                 # PDO
-                pdo_val = float(rates_latest.get("pdo", 0.0)) if isinstance(rates_latest, dict) else 0.0
+                pdo_val = float(rates_latest.get("pdo", 0.0))
                 add_metric("PDO Frames/s", f"{pdo_val:.1f}", "pdo")
 
                 # SDO (request + response)
-                sdo_res = float(rates_latest.get("sdo_res", 0.0)) if isinstance(rates_latest, dict) else 0.0
-                sdo_req = float(rates_latest.get("sdo_req", 0.0)) if isinstance(rates_latest, dict) else 0.0
+                sdo_res = float(rates_latest.get("sdo_res", 0.0))
+                sdo_req = float(rates_latest.get("sdo_req", 0.0))
                 sdo_val = sdo_res + sdo_req
                 # build combined history (element wise sum when lengths match)
                 sdo_hist_res = get_hist("sdo_res")
@@ -1118,7 +1103,7 @@ class display_tui:
                 sdo_hist = []
                 try:
                     if sdo_hist_res and sdo_hist_req and len(sdo_hist_res) == len(sdo_hist_req):
-                        sdo_hist = [a + b for a, b in zip(sdo_hist_res, sdo_hist_req)]
+                        sdo_hist = list(map(operator.add, sdo_hist_res, sdo_hist_req))
                     elif sdo_hist_res:
                         sdo_hist = list(sdo_hist_res)
                     elif sdo_hist_req:
@@ -1132,30 +1117,23 @@ class display_tui:
                     pass
 
                 # Heart beat
-                hb_val = float(rates_latest.get("hb", 0.0)) if isinstance(rates_latest, dict) else 0.0
+                hb_val = float(rates_latest.get("hb", 0.0))
                 add_metric("HB Frames/s", f"{hb_val:.1f}", "hb")
 
                 # Emergency Messages
-                emcy_val = float(rates_latest.get("emcy", 0.0)) if isinstance(rates_latest, dict) else 0.0
+                emcy_val = float(rates_latest.get("emcy", 0.0))
                 add_metric("EMCY Frames/s", f"{emcy_val:.1f}", "emcy")
 
                 # Total frames/s
-                total_val = float(rates_latest.get("total", 0.0)) if isinstance(rates_latest, dict) else 0.0
+                total_val = float(rates_latest.get("total", 0.0))
                 add_metric("Total Frames/s", f"{total_val:.1f}", "total")
 
                 # Peak frames/s
-                peak_val = float(getattr(snapshot.rates, "peak_fps", 0.0))
+                peak_val = float(snapshot.rates.peak_fps)
                 add_metric("Peak Frames/s", f"{peak_val:.1f}")
 
                 # Bus utilization (computed by bus_stats)
-                util = None
-                if hasattr(snapshot, "rates") and hasattr(snapshot.rates, "bus_util_percent"):
-                    util = snapshot.rates.bus_util_percent
-                elif hasattr(snapshot, "compute_bus_util"):
-                    try:
-                        util = snapshot.compute_bus_util()
-                    except Exception:
-                        util = None
+                util = snapshot.rates.bus_util_percent
 
                 idle = max(0.0, 100.0 - util) if util is not None else 0.0
                 add_metric("Bus Util %", f"{util:.2f}%" if util is not None else "-", "total")
@@ -1182,17 +1160,15 @@ class display_tui:
                 # Top talkers
                 try:
                     top = snapshot.top_talkers.most_common(analyzer_defs.MAX_STATS_SHOW)
-                    top_str = ", ".join(f"0x{c:03X}:{cnt}" for c, cnt in top) if top else "-"
+                    top_str = ", ".join(f"{analyzer_defs.cob_str(c)}:{cnt}" for c, cnt in top) if top else "-"
                     add_metric("Top Talkers", top_str)
                 except Exception:
                     add_metric("Top Talkers", "-")
 
                 # Frame distribution — show top-N kinds sorted by count (descending)
                 try:
-                    counts = snapshot.frame_count.counts
-                    items = sorted(((k.name, v) for k, v in counts.items()), key=lambda kv: kv[1], reverse=True)
-                    shown = items[:analyzer_defs.MAX_STATS_SHOW]
-                    dist_pairs = ", ".join(f"{name}:{cnt}" for name, cnt in shown) if shown else "-"
+                    shown = snapshot.frame_count.counts.most_common(analyzer_defs.MAX_STATS_SHOW)
+                    dist_pairs = ", ".join(f"{ftype.name}:{cnt}" for ftype, cnt in shown) if shown else "-"
                 except Exception:
                     dist_pairs = "-"
                 add_metric("Frame Dist.", dist_pairs)
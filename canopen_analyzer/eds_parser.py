@@ -23,7 +23,7 @@ exceptions.
 
 ### Responsibilities
 - Parse Object Dictionary entries and build a mapping of
-  `(index, subindex) -> ParameterName`
+  `(index << 8) | subindex -> ParameterName`
 - Parse RPDO/TPDO mapping objects (1Axx / 18xx) and construct
   COB-ID–to–mapping tables
 - Provide human-readable PDO field names for display backends (TUI/CLI/GUI)
@@ -31,8 +31,8 @@ exceptions.
 
 ### Design Notes
 - This module does **not** modify EDS files; it is strictly a consumer.
-- All parsing is performed using Python's ConfigParser in a tolerant mode
-  to support real-world EDS variations.
+- Parsing uses a minimal single-pass INI reader (see @ref eds_parser.load_cfg)
+  that is tolerant of real-world EDS variations.
 - The parser integrates with:
   - @ref FrameProcessor for PDO/SDO decoding
   - @ref BusStats for enriched protocol visibility
@@ -48,12 +48,33 @@ to be shared across worker threads once constructed.
 - All critical issues are logged using the module-scoped logger
 """
 
+import os
 import re
+import marshal
+import hashlib
 import logging
-import configparser
+import tempfile
 
 import analyzer_defs as analyzer_defs
 
+## Object section name, e.g. `[1000]` or `[0x1000]`.
+_IDX_RE = re.compile(r'^(?:0x)?([0-9A-Fa-f]+)$')
+
+## Sub-object section name with a hex sub-index, e.g. `[1A00sub1]`.
+_SUB_RE = re.compile(r'^(?:0x)?([0-9A-Fa-f]+)sub([0-9A-Fa-f]+)$', re.I)
+
+## Sub-object section name with a decimal sub-index, e.g. `[6000sub01]` or `[6000 sub1]`.
+_ENTRY_SUB_RE = re.compile(r'^(?:0x)?([0-9A-Fa-f]+)\s*sub0*(\d+)$', re.IGNORECASE)
+
+## File name suffix of the parsed-EDS cache files in the per-user cache directory.
+_CACHE_SUFFIX = ".eds.marshal"
+
+## Version of the cached map layout; bump when the parsed maps change shape.
+_CACHE_VERSION = 3
+
+## INI section header, e.g. `[1A00sub1]`.
+_SECTION_RE = re.compile(r"^\[(.+)\]")
+
 class eds_parser:
     """! Parser for CANopen EDS (Electronic Data Sheet) files.
     @details
@@ -81,7 +102,7 @@ class eds_parser:
         ## Path to the EDS file supplied to this parser (or None).
         self.eds_path = eds_path
 
-        ## Mapping of (index, subindex) -> human-readable ParameterName.
+        ## Mapping of packed `(index << 8) | subindex` -> human-readable ParameterName.
         self.name_map = {}
 
         ## Mapping of (index, subindex) -> OD entry metadata
@@ -101,62 +122,178 @@ class eds_parser:
 
         if eds_path:
             try:
-                self.name_map = self.build_name_map()
-                self.entry_map = self.build_entry_map()
+                # Reuse maps from an unchanged EDS, otherwise parse it once for all builders.
+                # The key is taken before parsing so an EDS edited mid-parse is not cached as fresh.
+                cache_key = self._cache_key()
+                if not self.load_cache(cache_key):
+                    cfg = self.load_cfg()
+
+                    self.name_map = self.build_name_map(cfg)
+                    self.entry_map = self.build_entry_map(cfg)
 
-                cfg = configparser.ConfigParser(strict=False)
-                cfg.optionxform = str
-                cfg.read(self.eds_path)
+                    self.tpdo_map = self.parse_pdo_map("1A", "18", cfg)
+                    self.rpdo_map = self.parse_pdo_map("16", "14", cfg)
+                    self.save_cache(cache_key)
 
-                self.tpdo_map = self.parse_pdo_map("1A", "18", cfg)
-                self.rpdo_map = self.parse_pdo_map("16", "14", cfg)
                 # Optional: keep legacy merged view
                 self.pdo_map = {**self.tpdo_map, **self.rpdo_map}
 
                 self.log_pdo_mapping_consistency()
-                self.log.info(f"Loaded EDS: {self.eds_path} (rpdo_map={len(self.rpdo_map)}, tpdo_map={len(self.tpdo_map)}, pdo_map={len(self.pdo_map)}, names={len(self.name_map)})")
+                self.log.info("Loaded EDS: %s (rpdo_map=%d, tpdo_map=%d, pdo_map=%d, names=%d)",
+                              self.eds_path, len(self.rpdo_map), len(self.tpdo_map), len(self.pdo_map), len(self.name_map))
             except Exception as e:
-                self.log.warning(f"Failed to parse EDS '{self.eds_path}': {e}")
+                self.log.warning("Failed to parse EDS '%s': %s", self.eds_path, e)
 
-    def build_name_map(self):
+    def _cache_key(self):
+        """! Identify the current EDS file contents for the parsed-map cache.
+        @return tuple (cache version, absolute path, mtime_ns, size) of the EDS file.
+        """
+        st = os.stat(self.eds_path)
+        return (_CACHE_VERSION, os.path.abspath(self.eds_path), st.st_mtime_ns, st.st_size)
+
+    def _cache_path(self) -> str:
+        """! Location of the cache file for this EDS in the per-user cache directory.
+        @details
+        Cache files live under `$XDG_CACHE_HOME/<app>` (default `~/.cache/<app>`),
+        never next to the EDS, and are named by a hash of the absolute EDS path.
+        @return str Path of the cache file.
+        """
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        digest = hashlib.sha256(os.path.abspath(self.eds_path).encode("utf-8")).hexdigest()
+        return os.path.join(base, analyzer_defs.APP_NAME, f"{digest}{_CACHE_SUFFIX}")
+
+    def load_cache(self, key) -> bool:
+        """! Load the parsed maps from the per-user cache if it is current.
+        @details
+        The cache is stored with `marshal`, which only rebuilds plain
+        int/str/tuple/list/dict values and cannot run code on load. It is only
+        used when the stored key (cache version, EDS path, modification time
+        and size) matches; any read or format problem is treated as a cache miss.
+        @param key Cache key of the EDS file, see _cache_key().
+        @return True if the maps were loaded from the cache.
+        """
+        path = self._cache_path()
+        try:
+            with open(path, "rb") as f:
+                data = marshal.load(f)
+            if not isinstance(data, dict) or data.get("key") != key:
+                return False
+            name_map = data["name_map"]
+            entry_map = data["entry_map"]
+            tpdo_map = data["tpdo_map"]
+            rpdo_map = data["rpdo_map"]
+            if not all(isinstance(m, dict) for m in (name_map, entry_map, tpdo_map, rpdo_map)):
+                return False
+        except Exception:
+            return False
+        self.name_map = name_map
+        self.entry_map = entry_map
+        self.tpdo_map = tpdo_map
+        self.rpdo_map = rpdo_map
+        self.log.debug("Loaded EDS maps for %s from cache: %s", self.eds_path, path)
+        return True
+
+    def save_cache(self, key):
+        """! Store the parsed maps in the per-user cache (best-effort).
+        @details
+        The cache directory is created private to the user (0700) and the file
+        is written to a 0600 temp file that is atomically swapped in with
+        `os.replace`, so a crash never leaves a partial cache behind.
+        @param key Cache key taken before the EDS was parsed, see _cache_key().
+        """
+        path = self._cache_path()
+        tmp = None
+        try:
+            data = {
+                "key": key,
+                "name_map": self.name_map,
+                "entry_map": self.entry_map,
+                "tpdo_map": self.tpdo_map,
+                "rpdo_map": self.rpdo_map,
+            }
+            cache_dir = os.path.dirname(path)
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")  # created 0600
+            with os.fdopen(fd, "wb") as f:
+                marshal.dump(data, f)
+            os.replace(tmp, path)
+            tmp = None
+        except Exception as e:
+            self.log.debug("EDS cache not written: %s", e)
+        finally:
+            if tmp is not None:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+
+    def load_cfg(self):
+        """! Parse the EDS file into a `{section: {key: value}}` dict in one pass.
+        @details
+        EDS files are plain `[section]` / `key=value` INI, so a single line
+        scan replaces ConfigParser and its per-line overhead. Matches the
+        tolerant ConfigParser setup used before: section and key case is
+        preserved, `;`/`#` comment lines are skipped, repeated sections are
+        merged and repeated keys keep the last value. Lines that are neither
+        a section header nor `key=value` are ignored.
+        @return dict Parsed EDS contents.
+        """
+        cfg = {}
+        section = None
+        with open(self.eds_path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line[0] in ";#":
+                    continue
+                m = _SECTION_RE.match(line)
+                if m:
+                    section = cfg.setdefault(m.group(1).strip(), {})
+                    continue
+                key, sep, value = line.partition("=")
+                if sep and section is not None:
+                    section[key.rstrip()] = value.lstrip()
+        return cfg
+
+    def build_name_map(self, cfg=None):
         """! Build a mapping from object dictionary entries to names.
         @details
         Parses the EDS/INI-style sections to find ParameterName entries for
-        indexes and subindexes. Creates entries keyed by (index, subindex).
+        indexes and subindexes. Creates entries keyed by the packed integer
+        `(index << 8) | subindex`, so lookups hash a single int instead of a tuple.
         If a subindex has no explicit ParameterName, the parent parameter name
         (index) is used; otherwise the parent is represented as "0x{index:04X}".
         Entries that include the word "highest" (case-insensitive) are treated
         as not providing a meaningful sub-ParameterName and the parent name is used.
-        @return dict A mapping {(index:int, sub:int): "Parent.ParameterName" or "Parent"}.
+        @param cfg Parsed EDS (see @ref load_cfg); the file is parsed if omitted.
+        @return dict A mapping {(index << 8) | sub: "Parent.ParameterName" or "Parent"}.
         """
         name_map = {}
-        cfg = configparser.ConfigParser(strict=False)
-        cfg.optionxform = str
-        cfg.read(self.eds_path)
+        if cfg is None:
+            cfg = self.load_cfg()
         parents = {}
-        for sec in cfg.sections():
-            m = re.match(r'^(?:0x)?([0-9A-Fa-f]+)$', sec)
+        subs = []
+        # single pass: record parents, defer subs until all parents are known
+        for sec, values in cfg.items():
+            m = _SUB_RE.match(sec)
             if m:
-                idx = int(m.group(1), 16)
-                pname = cfg[sec].get("ParameterName", "").strip()
-                if pname:
-                    parents[idx] = pname
-        for sec in cfg.sections():
-            m = re.match(r'^(?:0x)?([0-9A-Fa-f]+)sub([0-9A-Fa-f]+)$', sec, re.I)
-            if not m:
+                subs.append((int(m.group(1), 16), int(m.group(2), 16), values.get("ParameterName", "").strip()))
                 continue
-            idx, sub = int(m.group(1), 16), int(m.group(2), 16)
-            pname = cfg[sec].get("ParameterName", "").strip()
-            parent = parents.get(idx, f"0x{idx:04X}")
+            m = _IDX_RE.match(sec)
+            if m:
+                pname = values.get("ParameterName", "").strip()
+                if pname:
+                    parents[int(m.group(1), 16)] = pname
+        for idx, sub, pname in subs:
+            parent = parents.get(idx) or f"0x{idx:04X}"
             if pname and "highest" not in pname.lower():
-                name_map[(idx, sub)] = f"{parent}.{pname}"
+                name_map[(idx << 8) | sub] = f"{parent}.{pname}"
             else:
-                name_map[(idx, sub)] = parent
+                name_map[(idx << 8) | sub] = parent
         for idx, parent in parents.items():
-            name_map.setdefault((idx, 0), parent)
+            name_map.setdefault(idx << 8, parent)
         return name_map
 
-    def build_entry_map(self):
+    def build_entry_map(self, cfg=None):
         """! Build Object Dictionary entry metadata map.
         @details
         (index, sub) -> {
@@ -165,17 +302,17 @@ class eds_parser:
             bit_length,
             access_type
         }
+        @param cfg Parsed EDS (see @ref load_cfg); the file is parsed if omitted.
         """
         entry_map = {}
 
-        cfg = configparser.ConfigParser(strict=False)
-        cfg.optionxform = str
-        cfg.read(self.eds_path)
+        if cfg is None:
+            cfg = self.load_cfg()
 
         # --- pass 1: scalar objects (ObjectType = 0x7) ---
-        for sec in cfg.sections():
+        for sec in cfg:
             # match pure index sections: [6000], [0x6000]
-            m = re.match(r'^(?:0x)?([0-9A-Fa-f]+)$', sec)
+            m = _IDX_RE.match(sec)
             if not m:
                 continue
 
@@ -211,8 +348,8 @@ class eds_parser:
             }
 
         # --- pass 2: sub-objects (arrays / records) ---
-        for sec in cfg.sections():
-            m = re.match(r'^(?:0x)?([0-9A-Fa-f]+)\s*sub0*(\d+)$', sec, re.IGNORECASE)
+        for sec in cfg:
+            m = _ENTRY_SUB_RE.match(sec)
             if not m:
                 continue
 
@@ -260,8 +397,12 @@ class eds_parser:
 
         result = {}
 
-        for sec in cfg.sections():
-            if not sec.upper().startswith(map_prefix) or "SUB" in sec.upper():
+        # Reject most sections on a prefix slice instead of upper-casing every name
+        prefixes = frozenset((map_prefix.upper(), map_prefix.lower()))
+        n = len(map_prefix)
+
+        for sec in cfg:
+            if sec[:n] not in prefixes or "SUB" in sec.upper():
                 continue
 
             try:
@@ -306,5 +447,5 @@ class eds_parser:
         """
         for cob_id, entries in self.pdo_map.items():
             for (idx, sub, _) in entries:
-                if (idx, sub) not in self.name_map and (idx, 0) not in self.name_map:
-                    self.log.warning(f"COB 0x{cob_id:03X} maps to 0x{idx:04X}:{sub}, no ParameterName")
+                if ((idx << 8) | sub) not in self.name_map and (idx << 8) not in self.name_map:
+                    self.log.warning("COB 0x%03X maps to 0x%04X:%d, no ParameterName", cob_id, idx, sub)
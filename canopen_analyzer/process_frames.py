@@ -44,7 +44,9 @@ import json
 import struct
 import logging
 
-from datetime import datetime, timedelta, UTC
+from datetime import date, datetime, UTC
+from functools import lru_cache
+from collections import Counter
 
 import threading
 import queue
@@ -53,6 +55,120 @@ import analyzer_defs as analyzer_defs
 from eds_parser import eds_parser
 from bus_stats import bus_stats
 
+## CiA-301 TIME layout: ms after midnight (u32 LE), days since 1984-01-01 (u16 LE).
+_TIME_STRUCT = struct.Struct("<IH")
+
+## Proleptic ordinal of the CiA-301 TIME epoch (1984-01-01).
+_TIME_EPOCH_ORDINAL = date(1984, 1, 1).toordinal()
+
+## TIME frames decoded between refreshes of the cached current year.
+_TIME_YEAR_REFRESH = 1000
+
+@lru_cache(maxsize=64)
+def _time_date_str(days: int, current_year: int) -> str:
+    """! Convert CiA-301 TIME days to an ISO date string (cached per day value).
+    @param days Days since 1984-01-01.
+    @param current_year Current UTC year, upper bound of the sanity check.
+    @return ISO date, suffixed with `(likely-invalid)` if outside a sane range.
+    """
+    derived_date = date.fromordinal(_TIME_EPOCH_ORDINAL + days)
+    if 1990 <= derived_date.year <= current_year + 1:
+        return derived_date.isoformat()
+    return f"{derived_date.isoformat()} (likely-invalid)"
+
+## SDO header layout: command specifier (u8), index (u16 LE), sub-index (u8).
+_SDO_HDR = struct.Struct("<BHB")
+
+## SDO data field (bytes 4..7) as u32 LE.
+_SDO_U32 = struct.Struct("<I")
+
+## Valid data bytes of expedited SDO frames keyed by command specifier (n bits, CiA-301).
+_SDO_EXPEDITED_LEN = {cs: 4 - ((cs >> 2) & 0x03) for cs in (0x23, 0x27, 0x2B, 0x2F, 0x43, 0x47, 0x4B, 0x4F)}
+
+## Unsigned little-endian unpackers keyed by field width in bytes.
+_UINT_UNPACK = {
+    1: struct.Struct("<B").unpack_from,
+    2: struct.Struct("<H").unpack_from,
+    4: struct.Struct("<I").unpack_from,
+    8: struct.Struct("<Q").unpack_from,
+}
+
+def _uint_le(data) -> int:
+    """! Decode an unsigned little-endian field, with a precompiled struct for 1/2/4/8 bytes.
+    @param data Field bytes (any length; empty decodes to 0).
+    @return Unsigned integer value.
+    """
+    unpack = _UINT_UNPACK.get(len(data))
+    return unpack(data)[0] if unpack else int.from_bytes(data, "little")
+
+## EMCY header layout: error code (u16 LE), error register (u8).
+_EMCY_HDR = struct.Struct("<HB")
+
+## Byte translation table mapping non-printable bytes to '.' (EMCY manufacturer field).
+_EMCY_PRINTABLE = bytes(c if 32 <= c <= 126 else 0x2E for c in range(256))
+
+## EMCY error register text ("reg=0xRR[bbbbbbbb]", bits MSB..LSB), indexed by value.
+_ERR_REG_TEXT = tuple(f"reg=0x{i:02X}[{i:08b}]" for i in range(256))
+
+## Frame type of every 11-bit COB-ID (CiA-301 predefined connection set).
+_COB_FRAME_TYPE = [analyzer_defs.frame_type.UNKNOWN] * 0x800
+for _lo, _hi, _ftype in ((0x000, 0x000, analyzer_defs.frame_type.NMT),
+                         (0x080, 0x080, analyzer_defs.frame_type.SYNC),
+                         (0x081, 0x0FF, analyzer_defs.frame_type.EMCY),
+                         (0x100, 0x17F, analyzer_defs.frame_type.TIME),
+                         (0x180, 0x4FF, analyzer_defs.frame_type.PDO),
+                         (0x580, 0x5FF, analyzer_defs.frame_type.SDO_RES),
+                         (0x600, 0x67F, analyzer_defs.frame_type.SDO_REQ),
+                         (0x700, 0x7FF, analyzer_defs.frame_type.HB)):
+    _COB_FRAME_TYPE[_lo:_hi + 1] = [_ftype] * (_hi - _lo + 1)
+_COB_FRAME_TYPE = tuple(_COB_FRAME_TYPE)
+del _lo, _hi, _ftype
+
+## "0x%02X" strings for all sub-indices.
+_SUB_HEX = tuple(f"0x{i:02X}" for i in range(0x100))
+
+## "0x%04X" strings for OD indices, filled on first use (16-bit, mostly sparse).
+_IDX_HEX = {}
+
+## Display table ("pdo" / "sdo") per frame type; all other types go to "proto".
+_DISPLAY_BUCKET = {
+    analyzer_defs.frame_type.PDO: "pdo",
+    analyzer_defs.frame_type.SDO_REQ: "sdo",
+    analyzer_defs.frame_type.SDO_RES: "sdo",
+}
+
+## struct code and value renderer per fixed-width data type, for whole-PDO unpacking.
+## @details
+## Renderers match @ref process_frames.decode_by_datatype for the same types.
+_PDO_FIELD_CODECS = {
+    "BOOLEAN": ("B", bool),
+    "UNSIGNED8": ("B", lambda v: f"{v} [0x{v:02X}]"),
+    "UNSIGNED16": ("H", lambda v: f"{v} [0x{v:04X}]"),
+    "UNSIGNED32": ("I", lambda v: f"{v} [0x{v:08X}]"),
+    "INTEGER8": ("b", int),
+    "INTEGER16": ("h", int),
+    "INTEGER32": ("i", int),
+    "REAL32": ("f", lambda v: round(v, 2)),
+    "REAL64": ("d", lambda v: round(v, 2)),
+}
+
+## Precompiled single-value struct and renderer per fixed-width data type.
+## @details
+## Used by @ref process_frames.decode_by_datatype for SDO payloads and the
+## generic PDO path; short payloads fall back to the per-type slow path.
+_SCALAR_CODECS = {dt: (struct.Struct("<" + code), render) for dt, (code, render) in _PDO_FIELD_CODECS.items()}
+
+## NMT states reported by heartbeat frames.
+_HB_STATE_MAP = {
+    0x00: "Bootup",
+    0x04: "Stopped",
+    0x05: "Operational",
+    0x7F: "Pre-operational",
+}
+
+## Heartbeat state text ("state=0xSS [name]") for every possible state byte.
+_HB_STATE_TEXT = tuple(f"state=0x{i:02X} [{_HB_STATE_MAP.get(i, 'Unknown')}]" for i in range(256))
+
 class process_frames(threading.Thread):
 
     def _sdo_has_index(self, cs: int) -> bool:
@@ -66,7 +182,7 @@ class process_frames(threading.Thread):
            updates @ref bus_stats, optionally exports processed rows to CSV, and
            handles SDO/SDO-response bookkeeping using an EDS map.
     @details
-    The processor reads frame dictionaries from `raw_frame`, performs:
+    The processor reads @ref analyzer_defs.can_frame tuples from `raw_frame`, performs:
       - frame classification (NMT, SYNC, EMCY, TIME, PDO, SDO_REQ, SDO_RES, HB, UNKNOWN),
       - top-talker and node tracking,
       - SDO request/response timing and success/abort accounting,
@@ -75,43 +191,108 @@ class process_frames(threading.Thread):
     The thread is stoppable via `stop()` and will close CSV resources on exit.
     """
 
-    def __init__(self, stats: bus_stats, raw_frame: queue.Queue, processed_frame: queue.Queue, eds_map: eds_parser, export: str | None = None):
+    def __init__(self, stats: bus_stats, raw_frame: queue.SimpleQueue, processed_frame: queue.SimpleQueue, eds_map: eds_parser, export: str | None = None,
+                 cpu_affinity: int | None = None, rt_priority: int | None = None):
         """! Initialize the processor thread.
         @details
         The constructor stores references to required helpers, initializes a
         stop event and logging, sets up CSV export if requested, and ensures
         statistics collection start time is set.
         @param stats Instance of @ref bus_stats used to record statistics.
-        @param raw_frame `queue.Queue` providing raw frames (dict) from the sniffer.
-        @param processed_frame `queue.Queue` instance to push processed frames for display.
+        @param raw_frame `queue.SimpleQueue` (or `queue.Queue`) providing raw @ref analyzer_defs.can_frame tuples from the sniffer.
+        @param processed_frame `queue.SimpleQueue` instance to push processed frames for display.
+               Each queue item is a list of the frame dicts decoded from one drained batch of CAN frames;
+               each dict carries a pre-rendered display `row`, its table `bucket` and fixed-mode `key`.
         @param eds_map Instance of @ref eds_parser from eds_parser.py used to
                resolve Object Dictionary names and PDO mappings.
         @param export `csv`, `json`: enable export of processed frames to a file.
+        @param cpu_affinity CPU index to pin the processor thread to (optional).
+        @param rt_priority SCHED_FIFO priority for the processor thread (optional, needs root).
         """
         super().__init__(daemon=True)
 
-        ## Queue from which raw frame dictionaries are consumed.
+        ## Queue from which raw @ref analyzer_defs.can_frame tuples are consumed.
         self.raw_frame = raw_frame
 
-        ## Queue from which raw frame dictionaries are consumed.
+        ## Queue to which processed frame groups (one list per drained batch) are pushed.
         self.processed_frame = processed_frame
 
+        ## Processed frames decoded from the current batch of CAN frames, pushed as one queue item.
+        self._frame_group = []
+
+        ## Capture time of the current CAN frame, formatted once for all entries decoded from it.
+        self._frame_time = ""
+
         ## Internal event used to signal the run loop to stop.
         self._stop_event = threading.Event()
 
         ## Logger instance scoped to this processor.
         self.log = logging.getLogger(f"{analyzer_defs.APP_NAME}.{self.__class__.__name__}")
 
+        ## CPU the thread is pinned to on start (None keeps the default).
+        self.cpu_affinity = cpu_affinity
+
+        ## SCHED_FIFO priority applied on start (None keeps the default).
+        self.rt_priority = rt_priority
+
         ## EDS map/parser used to resolve (index, subindex) -> name strings.
         self.eds_map = eds_map
 
+        ## Frame type -> decoder method used by @ref _process_raw_frame (others use @ref _decode_other).
+        self._decoders = {
+            analyzer_defs.frame_type.SDO_REQ: self._decode_sdo_req,
+            analyzer_defs.frame_type.SDO_RES: self._decode_sdo_res,
+            analyzer_defs.frame_type.PDO: self._decode_pdo,
+            analyzer_defs.frame_type.TIME: self._decode_time,
+            analyzer_defs.frame_type.EMCY: self._decode_emcy,
+            analyzer_defs.frame_type.HB: self._decode_hb,
+        }
+
+        ## (frame type, decoder) for every 11-bit COB-ID: classification and dispatch in one lookup.
+        self._cob_dispatch = tuple((ftype, self._decoders.get(ftype, self._decode_other))
+                                   for ftype in _COB_FRAME_TYPE)
+
+        ## (frame type, decoder) for COB-IDs outside the 11-bit range.
+        self._unknown_dispatch = (analyzer_defs.frame_type.UNKNOWN, self._decode_other)
+
+        ## Per-COB PDO decode plans (or None when the mapping needs the generic path), see @ref _build_pdo_plan.
+        self._pdo_plans = {}
+
+        ## Memoized (index, sub) -> PDO entry display name, see @ref _lookup_name.
+        self._resolve_name = lru_cache(maxsize=1024)(self._lookup_name)
+
+        ## Memoized (index, sub) -> (entry, name, data_type, access_type), see @ref _lookup_od_entry.
+        self._resolve_od_entry = lru_cache(maxsize=4096)(self._lookup_od_entry)
+
         ## Reference to the bus_stats instance used for recording metrics.
         self.stats = stats
         self.stats.set_start_time()
 
+        ## Locally batched per-COB counts; frame type counts are derived from these
+        ## in @ref _merge_stats, so the hot path does a single int-keyed increment.
+        self._local_talkers = Counter()
+
+        ## Locally batched payload sizes.
+        self._local_payload = Counter()
+
+        ## Node ids seen since the last merge.
+        self._local_nodes = set()
+
+        ## Number of frames accumulated since the last merge.
+        self._local_pending = 0
+
         ## State for segmented SDO support: (node, index, sub) -> bytearray
         self._sdo_segments = {}
 
+        ## Whether per-frame warnings are written, resolved once when @ref run starts.
+        self._log_warn = False
+
+        ## Current UTC year for the TIME sanity check, refreshed every @ref _TIME_YEAR_REFRESH TIME frames.
+        self._current_year = datetime.now(UTC).year
+
+        ## TIME frames decoded since the last year refresh.
+        self._year_refresh = 0
+
         ## Flag indicating whether processed export is enabled :  None | csv | json.
         self.export = export
 
@@ -127,10 +308,25 @@ class process_frames(threading.Thread):
         ## Serial number for exported rows (increments each write).
         self.export_serial_number = 1
 
+        ## Processed CSV rows waiting to be written with a single writerows() call.
+        self._export_rows = []
+
+        ## Serial number at which the export file was last synced to disk.
+        self._export_synced_serial = 1
+
+        ## Set to request an `fsync` of the export file from @ref _export_sync_loop.
+        self._export_sync = threading.Event()
+
+        ## Tells @ref _export_sync_loop to exit at its next wake-up.
+        self._export_sync_stop = False
+
+        ## Background thread running @ref _export_sync_loop (or None without export).
+        self._export_sync_thread = None
+
         if self.export == "csv":
             try:
                 self.export_filename = f"{analyzer_defs.APP_NAME}_processed.csv"
-                self.export_file = open(self.export_filename, "w", newline="")
+                self.export_file = open(self.export_filename, "w", newline="", buffering=analyzer_defs.EXPORT_FILE_BUFFERING)
                 self.export_writer = csv.writer(self.export_file)
                 self.export_writer.writerow(
                     ["S.No.", "Time", "Type", "Direction", "COB-ID", "Index", "Sub", "Name", "Raw", "Decoded"]
@@ -140,7 +336,7 @@ class process_frames(threading.Thread):
                     os.fsync(self.export_file.fileno())
                 except Exception:
                     pass
-                self.log.info(f"CSV export enabled → {self.export_filename}")
+                self.log.info("CSV export enabled → %s", self.export_filename)
             except Exception as e:
                 self.log.exception("Failed to open CSV export file: %s", e)
                 self.export = False
@@ -148,17 +344,22 @@ class process_frames(threading.Thread):
         elif self.export == "json":
             try:
                 self.export_filename = f"{analyzer_defs.APP_NAME}_processed.json"
-                self.export_file = open(self.export_filename, "w")
+                self.export_file = open(self.export_filename, "w", buffering=analyzer_defs.EXPORT_FILE_BUFFERING)
 
                 self.export_file.write("[\n")
                 ## Identifier for first element of JSON file.
                 self._json_first = True
 
-                self.log.info(f"JSON export enabled → {self.export_filename}")
+                self.log.info("JSON export enabled → %s", self.export_filename)
             except Exception as e:
                 self.log.exception("Failed to open JSON export file: %s", e)
                 self.export = False
 
+        if self.export:
+            self._export_sync_thread = threading.Thread(target=self._export_sync_loop,
+                                                        name=f"{self.__class__.__name__}-sync",
+                                                        daemon=True)
+
     def _json_safe_processed_frame(self, frame: dict) -> dict:
         """! Create a processed frame for saving to JSON."""
 
@@ -177,55 +378,99 @@ class process_frames(threading.Thread):
     def export_processed_frame(self, frame: dict):
         """! Save a processed frame row to the processed CSV file.
         @details
-        Writes processed frame to export file. Periodically flushes
-        and `fsyncs` the file according to `defs.FSYNC_EVERY`.
+        CSV rows are collected and written in batches of `defs.EXPORT_ROW_BATCH`
+        by @ref _flush_export_rows, which also schedules an `fsync` according
+        to `defs.FSYNC_EVERY`.
         @param frame Processed frame.
         """
         if not self.export:
             return
 
         if self.export == "csv":
-            try:
-                self.export_writer.writerow([
-                    self.export_serial_number,
-                    frame["time"],
-                    frame["type"].name,
-                    frame["dir"],
-                    f"0x{frame['cob']:03X}",
-                    f"0x{frame['index']:04X}",
-                    f"0x{frame['sub']:02X}",
-                    frame["name"],
-                    frame["raw"],
-                    frame["decoded"],
-                ])
-                self.export_serial_number += 1
-                try:
-                    self.export_file.flush()
-                    if (self.export_serial_number % analyzer_defs.FSYNC_EVERY) == 0:
-                        os.fsync(self.export_file.fileno())
-                except Exception:
-                    pass
-            except Exception as e:
-                self.log.error("CSV export failed: %s", e)
+            self._export_rows.append([
+                self.export_serial_number,
+                frame["time"],
+                frame["type"].name,
+                frame["dir"],
+                frame["cob_s"],
+                frame["idx_s"],
+                frame["sub_s"],
+                frame["name"],
+                frame["raw"],
+                frame["decoded"],
+            ])
+            self.export_serial_number += 1
+            if len(self._export_rows) >= analyzer_defs.EXPORT_ROW_BATCH:
+                self._flush_export_rows()
 
         elif self.export == "json":
             try:
                 obj = self._json_safe_processed_frame(frame)
 
-                if not self._json_first:
-                    self.export_file.write(",\n")
-                self._json_first = False
-
-                json.dump(obj, self.export_file, indent=2, ensure_ascii=False)
+                # one buffered write per object (json.dump writes every token separately)
+                text = json.dumps(obj, indent=2, ensure_ascii=False)
+                if self._json_first:
+                    self._json_first = False
+                    self.export_file.write(text)
+                else:
+                    self.export_file.write(",\n" + text)
+                self.export_serial_number += 1
 
+                # write out periodically; the sync thread does the fsync
                 try:
-                    self.export_file.flush()
+                    if (self.export_serial_number % analyzer_defs.FSYNC_EVERY) == 0:
+                        self.export_file.flush()
+                        self._export_sync.set()
                 except Exception:
                     pass
 
             except Exception as e:
                 self.log.error("JSON export failed: %s", e)
 
+    def _flush_export_rows(self):
+        """! Write pending processed CSV rows to the export file.
+        @details
+        Hands all batched rows to the CSV writer at once, then flushes the
+        file and requests an `fsync` from @ref _export_sync_loop once at least
+        `defs.FSYNC_EVERY` rows were written since the previous sync.
+        """
+        if not self._export_rows:
+            return
+
+        try:
+            self.export_writer.writerows(self._export_rows)
+            self._export_rows.clear()
+            try:
+                if self.export_serial_number - self._export_synced_serial >= analyzer_defs.FSYNC_EVERY:
+                    self.export_file.flush()
+                    self._export_sync.set()
+                    self._export_synced_serial = self.export_serial_number
+            except Exception:
+                pass
+        except Exception as e:
+            self._export_rows.clear()
+            self.log.error("CSV export failed: %s", e)
+
+    def _export_sync_loop(self):
+        """! Background `fsync` of the processed export file.
+        @details
+        The processor thread only flushes the file buffer and sets
+        @ref _export_sync; the disk wait of `os.fsync()` happens here, so it
+        never stalls decoding. Requests made while a sync is running are
+        coalesced into the next one. The final sync is done on close.
+        """
+
+        fd = self.export_file.fileno()
+        while True:
+            self._export_sync.wait()
+            self._export_sync.clear()
+            if self._export_sync_stop:
+                return
+            try:
+                os.fsync(fd)
+            except OSError:
+                pass
+
     def save_processed_frame(self, frame: dict):
         """! Save a fully processed CANopen frame in memory and export it to CSV.
         @details
@@ -236,41 +481,52 @@ class process_frames(threading.Thread):
         @param frame    Frame to be saved.
         """
 
+        cob = frame["cob"]
+        index = frame["index"]
+
+        # Classify once: display table and whether the OD entry was resolved
+        bucket = _DISPLAY_BUCKET.get(frame["type"], "proto")
+        unresolved = bucket != "proto" and index == 0x0000
+
+        # Unresolved OD frames are logged but not displayed
+        write_log = unresolved or analyzer_defs.is_debug_enabled(self.log)
+
         # Render decoded possibly already a string — only hex raw bytes
         frame["raw"] = analyzer_defs.bytes_to_hex(frame["raw"])
         frame["decoded"] = frame["decoded"] if isinstance(frame["decoded"], str) else analyzer_defs.bytes_to_hex(frame["decoded"])
 
-        # Save frame for downstream use
-        # self.save_frame(frame)
-
-        # Decide log level once
-        is_od_frame = frame["type"] in (
-            analyzer_defs.frame_type.PDO,
-            analyzer_defs.frame_type.SDO_REQ,
-            analyzer_defs.frame_type.SDO_RES,
-        )
-
-        log_fn = self.log.debug
-        if is_od_frame and frame["index"] == 0x0000:
-            log_fn = self.log.error
-
-        log_fn("Processed Frame: "
-               f"[{frame['time']}] "
-               f"[{frame['type']}] "
-               f"[0x{frame['cob']:03X}] "
-               f"[{frame['dir']}] "
-               f"[0x{frame['index']:04X}] "
-               f"[0x{frame['sub']:02X}] "
-               f"[{frame['name']}] "
-               f"[{frame['raw']}] "
-               f"[{frame['decoded']}]")
-
-        # Drop unresolved OD frames only
-        if not (is_od_frame and frame["index"] == 0x0000):
-            self.processed_frame.put(frame)
+        # Pre-format hex identifiers once for all display/export consumers (table lookups)
+        frame["cob_s"] = analyzer_defs.COB_HEX[cob] if cob < 0x800 else f"0x{cob:03X}"
+        frame["idx_s"] = _IDX_HEX.get(index) or _IDX_HEX.setdefault(index, f"0x{index:04X}")
+        frame["sub_s"] = _SUB_HEX[frame["sub"]]
+
+        # Only build the log line if it will be written
+        if write_log:
+            log_fn = self.log.error if unresolved else self.log.debug
+            log_fn("Processed Frame: [%s] [%s] [%s] [%s] [%s] [%s] [%s] [%s] [%s]",
+                   frame["time"], frame["type"], frame["cob_s"], frame["dir"],
+                   frame["idx_s"], frame["sub_s"], frame["name"], frame["raw"],
+                   frame["decoded"])
+
+        # Drop unresolved OD frames only; the group is pushed once per drained batch by run()
+        if not unresolved:
+            # Pre-render the display row so display threads only classify and append
+            frame["bucket"] = bucket
+            if bucket == "proto":
+                type_name = frame["type"].name
+                frame["key"] = (cob, type_name)
+                frame["row"] = {"time": frame["time"], "cob": frame["cob_s"], "type": type_name,
+                                "raw": frame["raw"], "decoded": frame["decoded"], "count": 1}
+            else:
+                frame["key"] = (cob, index, frame["sub"])
+                frame["row"] = {"time": frame["time"], "cob": frame["cob_s"], "dir": frame["dir"], "name": frame["name"],
+                                "index": frame["idx_s"], "sub": frame["sub_s"],
+                                "raw": frame["raw"], "decoded": frame["decoded"], "count": 1}
+            self._frame_group.append(frame)
 
         # Export to CSV
-        self.export_processed_frame(frame)
+        if self.export:
+            self.export_processed_frame(frame)
 
     def decode_by_datatype(self, raw: bytes, entry: dict | None):
         """!
@@ -282,19 +538,24 @@ class process_frames(threading.Thread):
 
         dt = entry["data_type"]
 
+        # ---------- FIXED-WIDTH NUMERIC (precompiled) ----------
+        codec = _SCALAR_CODECS.get(dt)
+        if codec is not None and len(raw) >= codec[0].size:
+            return codec[1](codec[0].unpack_from(raw, 0)[0])
+
         # ---------- BOOLEAN ----------
         if dt == "BOOLEAN":
-            return bool(int.from_bytes(raw[:1], "little"))
+            return bool(_uint_le(raw[:1]))
 
         # ---------- UNSIGNED ----------
         if dt == "UNSIGNED8":
-            val = int.from_bytes(raw[:1], "little")
+            val = _uint_le(raw[:1])
             return f"{val} [0x{val:02X}]"
         if dt == "UNSIGNED16":
-            val = int.from_bytes(raw[:2], "little")
+            val = _uint_le(raw[:2])
             return f"{val} [0x{val:04X}]"
         if dt == "UNSIGNED32":
-            val = int.from_bytes(raw[:4], "little")
+            val = _uint_le(raw[:4])
             return f"{val} [0x{val:08X}]"
 
         # ---------- SIGNED ----------
@@ -343,8 +604,47 @@ class process_frames(threading.Thread):
         # ---------- FALLBACK ----------
         return raw.hex(" ")
 
-    def _resolve_od_entry(self, index: int, sub: int):
-        """!Resolve Object Dictionary metadata for (index, sub)."""
+    def _lookup_name(self, index: int, sub: int) -> str:
+        """! Resolve the display name of a mapped PDO entry from the EDS name map.
+        @details
+        Falls back to the parent index name, then to `0xIIII:sub`. Called through
+        the memoized `_resolve_name` so each (index, sub) is resolved only once.
+        """
+
+        name_map = self.eds_map.name_map
+        return (
+            name_map.get((index << 8) | sub)
+            or name_map.get(index << 8)
+            or f"0x{index:04X}:{sub}"
+        )
+
+    def _build_pdo_plan(self, entries):
+        """! Precompile the decoding of one PDO mapping.
+        @details
+        When every mapped entry has a fixed-width numeric data type whose size
+        matches the mapping, the whole PDO is unpacked with one precompiled
+        `struct.Struct`. Field names and OD metadata are resolved once here.
+        @param entries List of (index, sub, size) mapping tuples.
+        @return (struct.Struct, fields) or None if the generic per-field path is needed.
+        """
+
+        code = "<"
+        fields = []
+        for (index, sub, size) in entries:
+            entry, _, data_type, access_type = self._resolve_od_entry(index, sub)
+            codec = _PDO_FIELD_CODECS.get(data_type) if entry else None
+            if codec is None or max(1, size // 8) != struct.calcsize(codec[0]):
+                return None
+            code += codec[0]
+            fields.append((index, sub, self._resolve_name(index, sub), data_type, access_type, codec[1]))
+        return struct.Struct(code), tuple(fields)
+
+    def _lookup_od_entry(self, index: int, sub: int):
+        """! Resolve Object Dictionary metadata for (index, sub).
+        @details
+        Called through the memoized `_resolve_od_entry`, so the entry lookup and
+        the `0xIIII:sub` fallback name are built once per (index, sub).
+        """
 
         try:
             entry = self.eds_map.entry_map.get((index, sub))
@@ -361,500 +661,537 @@ class process_frames(threading.Thread):
             entry.get("access_type"),
         )
 
-    def run(self):
-        """! Main processing loop.
+    def _merge_stats(self):
+        """! Flush locally batched counters into @ref bus_stats with one lock acquisition."""
+
+        if not self._local_pending:
+            return
+
+        # frame distribution by type, from the per-COB table (one pass per distinct COB)
+        unknown = analyzer_defs.frame_type.UNKNOWN
+        frames = Counter()
+        for cob, n in self._local_talkers.items():
+            frames[_COB_FRAME_TYPE[cob] if cob < 0x800 else unknown] += n
+
+        try:
+            self.stats.merge(frames, self._local_talkers, self._local_nodes, self._local_payload)
+        except Exception:
+            self.log.warning("Stats merge failed for %d frames", self._local_pending)
+        self._local_talkers.clear()
+        self._local_payload.clear()
+        self._local_nodes.clear()
+        self._local_pending = 0
+
+    def _process_raw_frame(self, frame: analyzer_defs.can_frame):
+        """! Classify, decode and publish a single raw frame.
         @details
-        Non-blocking, interruptable loop that pulls frame dicts from `raw_frame`,
-        classifies frames, updates `self.stats`, resolves names via `self.eds_map`,
-        decodes simple SDO payloads (expedited/data), exports CSV rows (if enabled),
-        and logs the processed frame details. Ensures resources are closed on exit.
+        Updates the locally batched counters and appends every decoded entry
+        to @ref _frame_group; the caller pushes the group and merges stats.
+        @param frame Raw @ref analyzer_defs.can_frame from the sniffer.
         """
-        self.log.info("Processor thread started")
-        get_timeout = 0.1
 
-        try:
-            while not self._stop_event.is_set():
-                try:
-                    frame = self.raw_frame.get(timeout=get_timeout)
-                except queue.Empty:
-                    continue
+        ts, direction, cob, error, raw = frame
+        self._frame_time = analyzer_defs.time_str(ts)
 
-                # Check if it's a transmission frames
-                is_tx = True if frame.get("type") == "tx" else False
+        # Check if it's a transmission frames
+        is_tx = direction == "tx"
 
-                # Extract fields (defensive)
-                cob = frame.get("cob")
-                error = frame.get("error")
-                raw = frame.get("raw")
+        # top talkers and frame distribution (batched, both derived from this by _merge_stats)
+        self._local_talkers[cob] += 1
 
-                # top talkers
-                try:
-                    self.stats.count_talker(cob)
-                except Exception:
-                    self.log.warning("count_talker failed for cob=%s", cob)
+        # nodes seen (extract node id)
+        node_id = cob & 0x7F
+        if node_id:
+            self._local_nodes.add(node_id)
 
-                # nodes seen (extract node id)
-                try:
-                    node_id = cob & 0x7F
-                    if 1 <= node_id <= 127:
-                        self.stats.add_node(node_id)
-                except Exception:
-                    pass
+        # frame type and decoder from one table lookup
+        ftype, decode = self._cob_dispatch[cob] if cob < 0x800 else self._unknown_dispatch
 
-                # frame distribution (use enums, not names)
-                ftype = analyzer_defs.frame_type.UNKNOWN
-                try:
-                    if cob == 0x000:
-                        ftype = analyzer_defs.frame_type.NMT
-                        self.stats.increment_frame(analyzer_defs.frame_type.NMT)
-                    elif cob == 0x080:
-                        ftype = analyzer_defs.frame_type.SYNC
-                        self.stats.increment_frame(analyzer_defs.frame_type.SYNC)
-                    elif 0x080 <= cob <= 0x0FF:
-                        ftype = analyzer_defs.frame_type.EMCY
-                        self.stats.increment_frame(analyzer_defs.frame_type.EMCY)
-                    elif 0x100 <= cob <= 0x17F:
-                        ftype = analyzer_defs.frame_type.TIME
-                        self.stats.increment_frame(analyzer_defs.frame_type.TIME)
-                    elif 0x180 <= cob <= 0x4FF:
-                        ftype = analyzer_defs.frame_type.PDO
-                        self.stats.increment_frame(analyzer_defs.frame_type.PDO)
-                    elif 0x580 <= cob <= 0x5FF:
-                        ftype = analyzer_defs.frame_type.SDO_RES
-                        self.stats.increment_frame(analyzer_defs.frame_type.SDO_RES)
-                    elif 0x600 <= cob <= 0x67F:
-                        ftype = analyzer_defs.frame_type.SDO_REQ
-                        self.stats.increment_frame(analyzer_defs.frame_type.SDO_REQ)
-                    elif 0x700 <= cob <= 0x7FF:
-                        ftype = analyzer_defs.frame_type.HB
-                        self.stats.increment_frame(analyzer_defs.frame_type.HB)
-                    else:
-                        ftype = analyzer_defs.frame_type.UNKNOWN
-                        self.stats.increment_frame(analyzer_defs.frame_type.UNKNOWN)
-                except Exception:
-                    self.log.warning("Error while classifying frame cob=%s", cob)
+        # detect error frames (python-can: is_error_frame)
+        if error:
+            try:
+                self.stats._stats.error.last_time = self._frame_time
+                self.stats._stats.error.last_frame = raw
+            except Exception:
+                pass
+            if self._log_warn:
+                self.log.warning("Error frame detected: %s", raw)
 
-                # detect error frames (python-can: is_error_frame)
-                if error:
-                    try:
-                        self.stats._stats.error.last_time = analyzer_defs.now_str()
-                        self.stats._stats.error.last_frame = raw
-                    except Exception:
-                        pass
-                    self.log.warning("Error frame detected: %s", raw)
+        # decode and publish through the per-type decoder
+        decode(cob, ftype, raw, is_tx, node_id)
 
-                # ---------------- SDO REQUEST (CLIENT → SERVER) ----------------
-                if ftype == analyzer_defs.frame_type.SDO_REQ and raw and len(raw) >= 4:
-                    try:
-                        cs = raw[0]
-                        index = raw[2] << 8 | raw[1]
-                        sub = raw[3]
+    def _decode_sdo_req(self, cob: int, ftype, raw, is_tx: bool, node_id: int):
+        """! Decode an SDO request (client → server) frame."""
 
-                        self.stats.update_sdo_request_time(index, sub)
+        if len(raw) < 4:
+            self._decode_other(cob, ftype, raw, is_tx, node_id)
+            return
 
-                        entry, name, data_type, access_type = self._resolve_od_entry(index, sub)
+        try:
+            cs, index, sub = _SDO_HDR.unpack_from(raw, 0)
 
-                        decoded = ""
-                        payload_len = 0
-                        publish = True
+            self.stats.update_sdo_request_time(index, sub)
 
-                        # ---- UPLOAD REQUEST (READ) ----
-                        if cs == 0x40:
-                            decoded = "READ"
-
-                        # ---- EXPEDITED DOWNLOAD (WRITE) ----
-                        elif cs in (0x2F, 0x2B, 0x23):
-                            unused = (cs >> 2) & 0x03
-                            payload_len = 4 - unused
-                            payload = raw[4:4 + payload_len]
-
-                            try:
-                                decoded = self.decode_by_datatype(payload, entry)
-                            except Exception:
-                                decoded = int.from_bytes(payload, "little", signed=False)
-
-                        # ---- SEGMENTED DOWNLOAD INIT (CLIENT → SERVER) ----
-                        elif (cs & 0xE0) == 0x20:
-                            # Store transfer context explicitly
-                            self._sdo_segments[(node_id, index, sub)] = {
-                                "data": bytearray(),
-                                "index": index,
-                                "sub": sub,
-                                "name": name,
-                                "data_type": data_type,
-                                "access_type": access_type,
-                                "entry": entry,
-                            }
-                            publish = False
-
-                        # ---- SEGMENTED DOWNLOAD SEGMENT ----
-                        elif (cs & 0xE0) == 0x00:
-                            publish = False
-
-                            # Find active segmented transfer for this node
-                            key = next(
-                                (k for k in self._sdo_segments if k[0] == node_id),
-                                None
-                            )
-                            if not key:
-                                return  # orphan segment → ignore
-
-                            ctx = self._sdo_segments[key]
-                            ctx["data"] += raw[1:8]
-
-                            last = cs & 0x01
-                            if last:
-                                ctx = self._sdo_segments.pop(key)
-
-                                full = bytes(ctx["data"])
-                                decoded = self.decode_by_datatype(full, ctx["entry"])
-
-                                index = ctx["index"]
-                                sub = ctx["sub"]
-                                name = ctx["name"]
-                                data_type = ctx["data_type"]
-                                access_type = ctx["access_type"]
-
-                                publish = True
-
-                        # ---- ABORT ----
-                        elif cs == 0x80:
-                            decoded = "ABORT"
-
-                        if payload_len > 0:
-                            try:
-                                self.stats.increment_payload(
-                                    analyzer_defs.frame_type.SDO_REQ, payload_len
-                                )
-                            except KeyError:
-                                self.log.error(f"SDO REQ Payload increment: {KeyError}")
-                                pass
-
-                        if publish:
-                            self.save_processed_frame({
-                                "time": analyzer_defs.now_str(),
-                                "cob": cob,
-                                "type": ftype,
-                                "dir": "TX" if is_tx else "RX",
-                                "index": index,
-                                "sub": sub,
-                                "name": name,
-                                "data_type": data_type,
-                                "access_type": access_type,
-                                "raw": raw,
-                                "decoded": decoded,
-                            })
+            entry, name, data_type, access_type = self._resolve_od_entry(index, sub)
 
-                    except Exception as e:
-                        self.log.warning(f"SDO_REQ processing failed: {e}")
+            decoded = ""
+            payload_len = 0
+            publish = True
 
-                # ---------------- SDO RESPONSE (SERVER → CLIENT) ----------------
-                elif ftype == analyzer_defs.frame_type.SDO_RES and raw and len(raw) >= 4:
-                    try:
-                        cs = raw[0]
-                        index = raw[2] << 8 | raw[1]
-                        sub = raw[3]
+            # ---- UPLOAD REQUEST (READ) ----
+            if cs == 0x40:
+                decoded = "READ"
 
-                        entry, name, data_type, access_type = self._resolve_od_entry(index, sub)
+            # ---- EXPEDITED DOWNLOAD (WRITE) ----
+            elif cs in (0x2F, 0x2B, 0x23):
+                payload_len = _SDO_EXPEDITED_LEN[cs]
+                payload = raw[4:4 + payload_len]
 
-                        decoded = ""
-                        payload_len = 0
-                        publish = True
+                try:
+                    decoded = self.decode_by_datatype(payload, entry)
+                except Exception:
+                    decoded = _uint_le(payload)
+
+            # ---- SEGMENTED DOWNLOAD INIT (CLIENT → SERVER) ----
+            elif (cs & 0xE0) == 0x20:
+                # Store transfer context explicitly
+                self._sdo_segments[(node_id, index, sub)] = {
+                    "data": bytearray(),
+                    "index": index,
+                    "sub": sub,
+                    "name": name,
+                    "data_type": data_type,
+                    "access_type": access_type,
+                    "entry": entry,
+                }
+                publish = False
+
+            # ---- SEGMENTED DOWNLOAD SEGMENT ----
+            elif (cs & 0xE0) == 0x00:
+                publish = False
+
+                # Find active segmented transfer for this node
+                key = next(
+                    (k for k in self._sdo_segments if k[0] == node_id),
+                    None
+                )
+                if not key:
+                    return  # orphan segment → ignore
+
+                ctx = self._sdo_segments[key]
+                ctx["data"] += raw[1:8]
+
+                last = cs & 0x01
+                if last:
+                    ctx = self._sdo_segments.pop(key)
+
+                    full = bytes(ctx["data"])
+                    decoded = self.decode_by_datatype(full, ctx["entry"])
+
+                    index = ctx["index"]
+                    sub = ctx["sub"]
+                    name = ctx["name"]
+                    data_type = ctx["data_type"]
+                    access_type = ctx["access_type"]
+
+                    publish = True
+
+            # ---- ABORT ----
+            elif cs == 0x80:
+                decoded = "ABORT"
+
+            if payload_len > 0:
+                self._local_payload[ftype] += payload_len
+
+            if publish:
+                self.save_processed_frame({
+                    "time": self._frame_time,
+                    "cob": cob,
+                    "type": ftype,
+                    "dir": "TX" if is_tx else "RX",
+                    "index": index,
+                    "sub": sub,
+                    "name": name,
+                    "data_type": data_type,
+                    "access_type": access_type,
+                    "raw": raw,
+                    "decoded": decoded,
+                })
+
+        except Exception as e:
+            if self._log_warn:
+                self.log.warning("SDO_REQ processing failed: %s", e)
+
+    def _decode_sdo_res(self, cob: int, ftype, raw, is_tx: bool, node_id: int):
+        """! Decode an SDO response (server → client) frame."""
+
+        if len(raw) < 4:
+            self._decode_other(cob, ftype, raw, is_tx, node_id)
+            return
 
-                        # ---- ABORT ----
-                        if cs == 0x80 and len(raw) >= 8:
-                            self.stats.increment_sdo_abort()
-                            abort_code = int.from_bytes(raw[4:8], "little")
-                            decoded = f"ABORT 0x{abort_code:08X}"
-
-                        # ---- SEGMENTED UPLOAD INIT ----
-                        elif (cs & 0xE0) == 0x40:
-                            self._sdo_segments[(node_id, index, sub)] = bytearray()
-                            decoded = "<SDO segmented upload start>"
-                            publish = False
-
-                        # ---- SEGMENTED UPLOAD SEGMENT ----
-                        elif (cs & 0xE0) == 0x00:
-                            key = (node_id, index, sub)
-                            publish = False
-
-                            if key in self._sdo_segments:
-                                self._sdo_segments[key] += raw[1:8]
-                                last = cs & 0x01
-                                payload_len = len(raw[1:8])
-
-                                if last:
-                                    full = bytes(self._sdo_segments.pop(key))
-                                    decoded = self.decode_by_datatype(full, entry)
-                                    self.stats.increment_sdo_success()
-                                    publish = True
-
-                        # ---- EXPEDITED UPLOAD ----
-                        elif cs in (0x43, 0x4B, 0x4F):
-                            self.stats.increment_sdo_success()
-                            n_unused = (cs >> 2) & 0x03
-                            data_len = 4 - n_unused
-                            payload = raw[4:4 + data_len]
-                            decoded = self.decode_by_datatype(payload, entry)
-                            payload_len = data_len
-
-                        # ---- DOWNLOAD ACK ----
-                        elif cs == 0x60:
-                            self.stats.increment_sdo_success()
-                            decoded = "OK"
-
-                        if payload_len:
-                            self.stats.increment_payload(analyzer_defs.frame_type.SDO_RES, payload_len)
-
-                        if publish:
-                            self.stats.update_sdo_response_time(index, sub)
-
-                            self.save_processed_frame({
-                                "time": analyzer_defs.now_str(),
-                                "cob": cob,
-                                "type": ftype,
-                                "dir": "TX" if is_tx else "RX",
-                                "index": index,
-                                "sub": sub,
-                                "name": name,
-                                "data_type": data_type,
-                                "access_type": access_type,
-                                "raw": raw,
-                                "decoded": decoded,
-                            })
+        try:
+            cs, index, sub = _SDO_HDR.unpack_from(raw, 0)
+
+            entry, name, data_type, access_type = self._resolve_od_entry(index, sub)
+
+            decoded = ""
+            payload_len = 0
+            publish = True
+
+            # ---- ABORT ----
+            if cs == 0x80 and len(raw) >= 8:
+                self.stats.increment_sdo_abort()
+                abort_code = _SDO_U32.unpack_from(raw, 4)[0]
+                decoded = f"ABORT 0x{abort_code:08X}"
+
+            # ---- SEGMENTED UPLOAD INIT ----
+            elif (cs & 0xE0) == 0x40:
+                self._sdo_segments[(node_id, index, sub)] = bytearray()
+                decoded = "<SDO segmented upload start>"
+                publish = False
+
+            # ---- SEGMENTED UPLOAD SEGMENT ----
+            elif (cs & 0xE0) == 0x00:
+                key = (node_id, index, sub)
+                publish = False
+
+                if key in self._sdo_segments:
+                    self._sdo_segments[key] += raw[1:8]
+                    last = cs & 0x01
+                    payload_len = len(raw[1:8])
+
+                    if last:
+                        full = bytes(self._sdo_segments.pop(key))
+                        decoded = self.decode_by_datatype(full, entry)
+                        self.stats.increment_sdo_success()
+                        publish = True
 
-                    except Exception as e:
-                        self.log.warning(f"SDO_RES processing failed: {e}")
-
-                # PDO frame
-                elif ftype == analyzer_defs.frame_type.PDO:
-                    payload_len = len(raw)
-                    self.stats.increment_payload(analyzer_defs.frame_type.PDO, payload_len)
-
-                    # -------------------------------------------------
-                    # Decide PDO role from EDS, NOT from TX/RX
-                    # -------------------------------------------------
-                    if cob in self.eds_map.tpdo_map:
-                        pdo_map = self.eds_map.tpdo_map
-                    elif cob in self.eds_map.rpdo_map:
-                        pdo_map = self.eds_map.rpdo_map
-                    else:
-                        pdo_map = None
-
-                    if pdo_map:
-                        entries = pdo_map[cob]
-                        offset = 0
-
-                        for (index, sub, size) in entries:
-                            size_bytes = max(1, size // 8)
-                            chunk = raw[offset:offset + size_bytes]
-                            offset += size_bytes
-
-                            try:
-                                entry, name, data_type, access_type = self._resolve_od_entry(index, sub)
-                                decoded = self.decode_by_datatype(chunk, entry)
-                            except Exception as e:
-                                self.log.warning("PDO decoding failed: {e}")
-                                decoded = int.from_bytes(chunk, "little", signed=False) if chunk else 0
-
-                            name = (
-                                self.eds_map.name_map.get((index, sub))
-                                or self.eds_map.name_map.get((index, 0))
-                                or f"0x{index:04X}:{sub}"
-                            )
-
-                            frame = {
-                                "time": analyzer_defs.now_str(),
-                                "cob": cob,
-                                "type": ftype,
-                                "dir": "TX" if is_tx else "RX",
-                                "index": index,
-                                "sub": sub,
-                                "name": name,
-                                "data_type": data_type,
-                                "access_type": access_type,
-                                "raw": raw,
-                                "decoded": decoded,
-                            }
-                            self.save_processed_frame(frame)
-
-                    else:
-                        frame = {
-                            "time": analyzer_defs.now_str(),
-                            "cob": cob,
-                            "type": ftype,
-                            "dir": "TX" if is_tx else "RX",
-                            "index": 0xFFFF,
-                            "sub": 0xFF,
-                            "name": "??",
-                            "data_type": "",
-                            "access_type": "",
-                            "raw": raw,
-                            "decoded": "No reference in EDS"
-                        }
-                        self.save_processed_frame(frame)
-
-                # TIME frame
-                elif ftype == analyzer_defs.frame_type.TIME:
-                    # CiA-301 TIME: 4 bytes = ms after midnight (LE), 2 bytes = days since 1984-01-01 (LE)
-                    try:
-                        if raw and len(raw) >= 6:
-                            ms = int.from_bytes(raw[0:4], "little")
-                            days = int.from_bytes(raw[4:6], "little")
-
-                            # compute time-of-day safely (wrap ms into 24 h)
-                            tod_ms = ms % 86_400_000
-                            hours = tod_ms // 3_600_000
-                            minutes = (tod_ms % 3_600_000) // 60_000
-                            seconds = (tod_ms % 60_000) // 1000
-                            ms_rem = tod_ms % 1000
-                            tod = f"{hours:02d}:{minutes:02d}:{seconds:02d}.{ms_rem:03d}"
-
-                            # convert days since 1984-01-01 → date (with sanity check)
-                            base = datetime(1984, 1, 1, tzinfo=UTC)
-                            derived_date = (base + timedelta(days=days)).date()
-
-                            current_year = datetime.now(UTC).year
-                            if 1990 <= derived_date.year <= current_year + 1:
-                                date_str = derived_date.isoformat()
-                            else:
-                                date_str = f"{derived_date.isoformat()} (likely-invalid)"
-
-                            decoded = f"[{date_str} {tod}], Days={days}"
-                        else:
-                            decoded = "Malformed (need ≥ 6 bytes)"
-                    except Exception as e:
-                        decoded = f"Decode error ({e})"
+            # ---- EXPEDITED UPLOAD ----
+            elif cs in (0x43, 0x4B, 0x4F):
+                self.stats.increment_sdo_success()
+                data_len = _SDO_EXPEDITED_LEN[cs]
+                payload = raw[4:4 + data_len]
+                decoded = self.decode_by_datatype(payload, entry)
+                payload_len = data_len
+
+            # ---- DOWNLOAD ACK ----
+            elif cs == 0x60:
+                self.stats.increment_sdo_success()
+                decoded = "OK"
+
+            if payload_len:
+                self._local_payload[ftype] += payload_len
+
+            if publish:
+                self.stats.update_sdo_response_time(index, sub)
+
+                self.save_processed_frame({
+                    "time": self._frame_time,
+                    "cob": cob,
+                    "type": ftype,
+                    "dir": "TX" if is_tx else "RX",
+                    "index": index,
+                    "sub": sub,
+                    "name": name,
+                    "data_type": data_type,
+                    "access_type": access_type,
+                    "raw": raw,
+                    "decoded": decoded,
+                })
+
+        except Exception as e:
+            if self._log_warn:
+                self.log.warning("SDO_RES processing failed: %s", e)
+
+    def _decode_pdo(self, cob: int, ftype, raw, is_tx: bool, node_id: int):
+        """! Decode a PDO frame into one entry per mapped object using the EDS PDO maps."""
+
+        payload_len = len(raw)
+        self._local_payload[ftype] += payload_len
+
+        # -------------------------------------------------
+        # Decide PDO role from EDS, NOT from TX/RX
+        # -------------------------------------------------
+        entries = self.eds_map.tpdo_map.get(cob)
+        if entries is None:
+            entries = self.eds_map.rpdo_map.get(cob)
+
+        if entries is not None:
+            offset = 0
+            # every mapped entry shows the same CAN payload: hex it once
+            raw_hex = raw.hex(" ").upper()
+            direction = "TX" if is_tx else "RX"
+            frame_time = self._frame_time
+            save = self.save_processed_frame
 
-                    # Save processed frame
-                    frame = {
-                        "time": analyzer_defs.now_str(),
+            try:
+                plan = self._pdo_plans[cob]
+            except KeyError:
+                plan = self._pdo_plans[cob] = self._build_pdo_plan(entries)
+
+            # fast path: all fields decoded by one C-level unpack
+            if plan is not None and len(raw) >= plan[0].size:
+                pdo_struct, fields = plan
+                for (index, sub, name, data_type, access_type, render), value in zip(fields, pdo_struct.unpack_from(raw, 0)):
+                    save({
+                        "time": frame_time,
                         "cob": cob,
                         "type": ftype,
-                        "dir": "TX" if is_tx else "RX",
-                        "index": 0,
-                        "sub": 0,
-                        "name": "TIME",
-                        "raw": raw,
-                        "data_type": "",
-                        "access_type": "",
-                        "decoded": decoded
-                    }
-                    self.save_processed_frame(frame)
-
-
-                # Emergency (EMCY) frame — generic decoding (no vendor-specific interpretation)
-                elif ftype == analyzer_defs.frame_type.EMCY:
-                    # EMCY format (generic): bytes 0..1 = 16-bit error code (LE),
-                    # byte 2 = error register (bitfield), bytes 3..7 = manufacturer-specific bytes (raw hex)
+                        "dir": direction,
+                        "index": index,
+                        "sub": sub,
+                        "name": name,
+                        "data_type": data_type,
+                        "access_type": access_type,
+                        "raw": raw_hex,
+                        "decoded": render(value),
+                    })
+                return
+
+            raw_len = len(raw)
+            for (index, sub, size) in entries:
+                size_bytes = max(1, size // 8)
+                start = offset
+                offset += size_bytes
+
+                entry, name, data_type, access_type = self._resolve_od_entry(index, sub)
+
+                # fixed-width fields are unpacked in place; only the remaining types need a slice
+                codec = _SCALAR_CODECS.get(data_type) if entry else None
+                if codec is not None and codec[0].size <= size_bytes and start + codec[0].size <= raw_len:
+                    decoded = codec[1](codec[0].unpack_from(raw, start)[0])
+                else:
+                    chunk = raw[start:offset]
                     try:
-                        if raw and len(raw) >= 3:
-                            # 0..1 = 16-bit error code (little-endian)
-                            error_code = int.from_bytes(raw[0:2], "little")
-                            # byte 2 = error register (bitfield)
-                            error_reg = raw[2]
-                            # bytes 3..7 = up to 5 bytes manufacturer-specific
-                            manuf_bytes = raw[3:8] if len(raw) > 3 else b""
-
-                            # error register as 8-bit binary string (MSB..LSB)
-                            err_bits = f"{error_reg:08b}"
-
-                            # manufact bytes -> printable ASCII (replace non-printable with '.'),
-                            # strip trailing NULs for neatness
-                            def bytes_to_printable(b: bytes) -> str:
-                                if not b:
-                                    return ""
-                                s = "".join((chr(x) if 32 <= x <= 126 else ".") for x in b)
-                                # strip trailing dots that came from NULs (0x00)
-                                s = s.rstrip(".")
-                                return s
-
-                            manuf_ascii = bytes_to_printable(manuf_bytes)
-
-                            # final compact output: hex error code, binary error register, manuf ASCII
-                            decoded = f"[0x{error_code:04X}], reg=0x{error_reg:02X}[{err_bits}], manuf={manuf_ascii}"
-                        else:
-                            decoded = "Malformed (need >=3 bytes)"
+                        decoded = self.decode_by_datatype(chunk, entry)
                     except Exception as e:
-                        decoded = f"Decode error ({e})"
+                        if self._log_warn:
+                            self.log.warning("PDO decoding failed: %s", e)
+                        decoded = _uint_le(chunk)
+
+                name = self._resolve_name(index, sub)
+
+                save({
+                    "time": frame_time,
+                    "cob": cob,
+                    "type": ftype,
+                    "dir": direction,
+                    "index": index,
+                    "sub": sub,
+                    "name": name,
+                    "data_type": data_type,
+                    "access_type": access_type,
+                    "raw": raw_hex,
+                    "decoded": decoded,
+                })
+
+        else:
+            frame = {
+                "time": self._frame_time,
+                "cob": cob,
+                "type": ftype,
+                "dir": "TX" if is_tx else "RX",
+                "index": 0xFFFF,
+                "sub": 0xFF,
+                "name": "??",
+                "data_type": "",
+                "access_type": "",
+                "raw": raw,
+                "decoded": "No reference in EDS"
+            }
+            self.save_processed_frame(frame)
+
+    def _decode_time(self, cob: int, ftype, raw, is_tx: bool, node_id: int):
+        """! Decode a CiA-301 TIME frame."""
+
+        # CiA-301 TIME: 4 bytes = ms after midnight (LE), 2 bytes = days since 1984-01-01 (LE)
+        if len(raw) >= 6:
+            ms, days = _TIME_STRUCT.unpack_from(raw, 0)
+
+            # compute time-of-day safely (wrap ms into 24 h)
+            secs, ms_rem = divmod(ms % 86_400_000, 1000)
+            mins, seconds = divmod(secs, 60)
+            hours, minutes = divmod(mins, 60)
+            tod = f"{hours:02d}:{minutes:02d}:{seconds:02d}.{ms_rem:03d}"
+
+            # convert days since 1984-01-01 → date (with sanity check)
+            self._year_refresh += 1
+            if self._year_refresh >= _TIME_YEAR_REFRESH:
+                self._current_year = datetime.now(UTC).year
+                self._year_refresh = 0
+            date_str = _time_date_str(days, self._current_year)
+
+            decoded = f"[{date_str} {tod}], Days={days}"
+        else:
+            decoded = "Malformed (need ≥ 6 bytes)"
+
+        # Save processed frame
+        frame = {
+            "time": self._frame_time,
+            "cob": cob,
+            "type": ftype,
+            "dir": "TX" if is_tx else "RX",
+            "index": 0,
+            "sub": 0,
+            "name": "TIME",
+            "raw": raw,
+            "data_type": "",
+            "access_type": "",
+            "decoded": decoded
+        }
+        self.save_processed_frame(frame)
+
+    def _decode_emcy(self, cob: int, ftype, raw, is_tx: bool, node_id: int):
+        """! Decode an EMCY frame generically (no vendor-specific interpretation)."""
+
+        # EMCY format (generic): bytes 0..1 = 16-bit error code (LE),
+        # byte 2 = error register (bitfield), bytes 3..7 = manufacturer-specific bytes (raw hex)
+        if len(raw) >= 3:
+            # 0..1 = 16-bit error code (little-endian), byte 2 = error register (bitfield)
+            error_code, error_reg = _EMCY_HDR.unpack_from(raw, 0)
+            # bytes 3..7 = up to 5 bytes manufacturer-specific
+            manuf_bytes = raw[3:8]
+
+            # manufact bytes -> printable ASCII (replace non-printable with '.'),
+            # strip trailing dots that came from NULs (0x00) for neatness
+            manuf_ascii = manuf_bytes.translate(_EMCY_PRINTABLE).rstrip(b".").decode("ascii")
+
+            # final compact output: hex error code, binary error register, manuf ASCII
+            decoded = f"[0x{error_code:04X}], {_ERR_REG_TEXT[error_reg]}, manuf={manuf_ascii}"
+        else:
+            decoded = "Malformed (need >=3 bytes)"
+
+        frame = {
+            "time": self._frame_time,
+            "cob": cob,
+            "type": ftype,
+            "dir": "TX" if is_tx else "RX",
+            "index": 0,
+            "sub": 0,
+            "name": "EMCY",
+            "data_type": "",
+            "access_type": "",
+            "raw": raw,
+            "decoded": decoded
+            }
+        self.save_processed_frame(frame)
+
+    def _decode_hb(self, cob: int, ftype, raw, is_tx: bool, node_id: int):
+        """! Decode a heartbeat frame."""
+
+        # Heartbeat: single status byte. COB-ID = 0x700 + nodeID
+        if raw:
+            decoded = f"Node={node_id}, {_HB_STATE_TEXT[raw[0]]}"
+        else:
+            decoded = "Malformed (need >=1 byte)"
+
+        frame = {
+            "time": self._frame_time,
+            "cob": cob,
+            "type": ftype,
+            "dir": "TX" if is_tx else "RX",
+            "index": 0,
+            "sub": 0,
+            "name": "HB",
+            "data_type": "",
+            "access_type": "",
+            "raw": raw,
+            "decoded": decoded
+        }
+        self.save_processed_frame(frame)
+
+    def _decode_other(self, cob: int, ftype, raw, is_tx: bool, node_id: int):
+        """! Publish frames without a dedicated decoder (NMT, SYNC, unknown) as-is."""
+
+        frame = {
+            "time": self._frame_time,
+            "cob": cob,
+            "type": ftype,
+            "dir": "TX" if is_tx else "RX",
+            "index": 0,
+            "sub": 0,
+            "name": "",
+            "data_type": "",
+            "access_type": "",
+            "raw": raw,
+            "decoded": ""
+        }
+        self.save_processed_frame(frame)
 
-                    frame = {
-                        "time": analyzer_defs.now_str(),
-                        "cob": cob,
-                        "type": ftype,
-                        "dir": "TX" if is_tx else "RX",
-                        "index": 0,
-                        "sub": 0,
-                        "name": "EMCY",
-                        "data_type": "",
-                        "access_type": "",
-                        "raw": raw,
-                        "decoded": decoded
-                        }
-                    self.save_processed_frame(frame)
-
-
-                # Heartbeat (HB) frame
-                elif ftype == analyzer_defs.frame_type.HB:
-                    # Heartbeat: single status byte. COB-ID = 0x700 + nodeID
-                    try:
-                        if raw and len(raw) >= 1:
-                            state = raw[0]
-                            state_map = {
-                                0x00: "Bootup",
-                                0x04: "Stopped",
-                                0x05: "Operational",
-                                0x7F: "Pre-operational",
-                            }
-                            node = cob & 0x7F
-                            decoded = f"Node={node}, state=0x{state:02X} [{state_map.get(state, 'Unknown')}]"
-                        else:
-                            decoded = "Malformed (need >=1 byte)"
-                    except Exception as e:
-                        decoded = f"Decode error ({e})"
+    def run(self):
+        """! Main processing loop.
+        @details
+        Interruptable loop that drains `raw_frame` in batches (blocking when it
+        is empty; a `None` sentinel from `stop()` ends it),
+        classifies frames, updates `self.stats`, resolves names via `self.eds_map`,
+        decodes simple SDO payloads (expedited/data), exports CSV rows (if enabled),
+        and logs the processed frame details. Ensures resources are closed on exit.
+        """
+        self.log.info("Processor thread started")
+        analyzer_defs.apply_thread_scheduling(self.log, self.cpu_affinity, self.rt_priority)
+        self._log_warn = analyzer_defs.is_warning_enabled(self.log)
+        if self._export_sync_thread is not None:
+            self._export_sync_thread.start()
+
+        # bind hot attributes once; the loop runs for every received frame
+        raw_frame = self.raw_frame
+        # SimpleQueue keeps no unfinished-task count
+        task_done = getattr(raw_frame, "task_done", None)
+        processed_put = self.processed_frame.put
+        stopping = self._stop_event.is_set
+        drain = analyzer_defs.drain_queue
+        drain_batch = analyzer_defs.QUEUE_DRAIN_BATCH
+        merge_every = analyzer_defs.STATS_MERGE_EVERY
+        process = self._process_raw_frame
+        merge_stats = self._merge_stats
+        flush_rows = self._flush_export_rows if self.export == "csv" else None
 
-                    frame = {
-                        "time": analyzer_defs.now_str(),
-                        "cob": cob,
-                        "type": ftype,
-                        "dir": "TX" if is_tx else "RX",
-                        "index": 0,
-                        "sub": 0,
-                        "name": "HB",
-                        "data_type": "",
-                        "access_type": "",
-                        "raw": raw,
-                        "decoded": decoded
-                    }
-                    self.save_processed_frame(frame)
-
-
-                # Other frames type
-                else:
-                    frame = {
-                        "time": analyzer_defs.now_str(),
-                        "cob": cob,
-                        "type": ftype,
-                        "dir": "TX" if is_tx else "RX",
-                        "index": 0,
-                        "sub": 0,
-                        "name": "",
-                        "data_type": "",
-                        "access_type": "",
-                        "raw": raw,
-                        "decoded": ""
-                    }
-                    self.save_processed_frame(frame)
-
-                # optionally mark task done if using task tracking
-                try:
-                    self.raw_frame.task_done()
-                except Exception:
-                    pass
+        try:
+            while not stopping():
+                # Take everything already queued under one lock acquisition
+                frames = drain(raw_frame, drain_batch)
+                if not frames:
+                    # Block until a frame arrives; stop() wakes us with a None sentinel
+                    frames = [raw_frame.get()]
+                    if task_done is not None:
+                        task_done()
+
+                sentinel = False
+                for frame in frames:
+                    if frame is None:
+                        sentinel = True
+                        break
+
+                    process(frame)
+
+                    self._local_pending += 1
+                    if self._local_pending >= merge_every:
+                        merge_stats()
+
+                # push all entries decoded from this batch with a single put
+                group = self._frame_group
+                if group:
+                    processed_put(group)
+                    self._frame_group = []
+
+                if sentinel:
+                    return
+
+                # merge the remaining batched counters and export rows once the queue drains
+                if raw_frame.empty():
+                    merge_stats()
+                    if flush_rows is not None:
+                        flush_rows()
 
         finally:
+            self._merge_stats()
+            if self._export_sync_thread is not None and self._export_sync_thread.is_alive():
+                self._export_sync_stop = True
+                self._export_sync.set()
+                self._export_sync_thread.join()
             if self.export == "csv" and self.export_file:
                 try:
+                    self._flush_export_rows()
                     try:
                         self.export_file.flush()
                         os.fsync(self.export_file.fileno())
@@ -872,18 +1209,20 @@ class process_frames(threading.Thread):
                         os.fsync(self.export_file.fileno())
                     except Exception:
                         pass
-                        self.export_file.close()
-                        self.log.info("Processed JSON export file closed")
+                    self.export_file.close()
+                    self.log.info("Processed JSON export file closed")
                 except Exception:
-                    self.log.exception("Failed to close processed CSV file")
+                    self.log.exception("Failed to close processed JSON file")
             self.log.info("Processor thread exiting")
 
     def stop(self):
         """! Request the processor thread to stop.
         @details
-        Signals the internal stop event so the processing loop exits at the
-        next opportunity. This method does not block waiting for thread exit;
+        Signals the internal stop event and enqueues a `None` sentinel so the
+        blocking processing loop wakes up and exits at the next opportunity. This method does not block waiting for thread exit;
         call `join()` on the thread object if synchronous shutdown is required.
         """
         self._stop_event.set()
+        # Wake the blocking get() in run()
+        self.raw_frame.put(None)
         self.log.debug("Stop requested for processor thread")
\ No newline at end of file
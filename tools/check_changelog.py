@@ -26,10 +26,33 @@ import os
 import re
 import subprocess
 import sys
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 CHANGELOG = "CHANGELOG.md"
 
+# Precompiled patterns (shared by the block finder and --fix); [^\S\n] keeps matches on one line
+_UNRELEASED_RE = re.compile(r'^[^\S\n]*#[^\n]*unreleased', re.IGNORECASE | re.MULTILINE)  # Unreleased header
+_NEXT_RE = re.compile(r'^[^\S\n]*##[^\S\n]+', re.MULTILINE)                           # next top-level header
+
+# "not passed" marker for optional arguments where None is meaningful
+_UNSET = object()
+
+def _is_heading(line: str) -> bool:
+    # "# " .. "###### " (line is already stripped)
+    level = len(line) - len(line.lstrip('#'))
+    return 1 <= level <= 6 and line[level:level + 1].isspace()
+
+def _is_link_ref(line: str) -> bool:
+    # "[v0.1.0]: https://..." reference lines
+    if not line.startswith('['):
+        return False
+    i = line.find(']:', 2)
+    while i != -1:
+        if line[i + 2:].lstrip().startswith(('http://', 'https://')):
+            return True
+        i = line.find(']:', i + 1)
+    return False
+
 def read_changelog(path: str) -> str:
     # Read with utf-8 and strip BOM if present
     with open(path, "rb") as fh:
@@ -41,37 +64,42 @@ def read_changelog(path: str) -> str:
         text = data.decode("utf-8")
     except Exception:
         text = data.decode("utf-8", errors="replace")
+    # normalise line endings so --fix writes uniform LF even for a CRLF changelog
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
     return text
 
+def _locate_unreleased(text: str) -> Optional[Tuple[int, int]]:
+    """
+    Return (start, end) offsets of the Unreleased block body in text, or None.
+    start is just past the header line, end is the start of the next top-level
+    '##' header (or the end of the text).
+    """
+    m = _UNRELEASED_RE.search(text)
+    if m is None:
+        return None
+    start = text.find('\n', m.end())
+    start = len(text) if start == -1 else start + 1
+    nxt = _NEXT_RE.search(text, start)
+    return start, (nxt.start() if nxt else len(text))
+
 def find_unreleased_block_simple(text: str) -> Optional[str]:
     """
     More tolerant approach:
-    - Split file into lines.
-    - Find first line index where lowercased line contains 'unreleased' and '##' (top-level)
-    - The block is the lines after that until the next line that starts with '##' (top-level header).
+    - Find the first header-like line ('#' after optional whitespace, NBSP included)
+      that mentions 'unreleased' (case-insensitive).
+    - The block is the text after that line until the next line that starts with '##' (top-level header).
+    Both are located with regex searches over the whole text, without splitting it into lines.
     """
-    lines = text.splitlines()
-    idx = None
-    for i, ln in enumerate(lines):
-        # Normalize whitespace, replace NBSPs with plain space for matching
-        norm = ln.replace('\u00A0', ' ').strip()
-        if 'unreleased' in norm.lower() and norm.lstrip().startswith('#'):
-            # we found a header-like line that mentions unreleased
-            idx = i
-            break
-    if idx is None:
+    return _block_at(text, _locate_unreleased(text))
+
+def _block_at(text: str, loc: Optional[Tuple[int, int]]) -> Optional[str]:
+    # block body for offsets from _locate_unreleased (None if there is no header)
+    if loc is None:
         return None
-    # collect lines after idx until next top-level '##' header
-    j = idx + 1
-    while j < len(lines):
-        ln = lines[j]
-        # next top-level header starts with '##' after optional spaces
-        if re.match(r'^\s*##\s+', ln):
-            break
-        j += 1
-    # return joined block (lines between idx+1 and j)
-    block_lines = lines[idx+1:j]
-    return "\n".join(block_lines)
+    block = text[loc[0]:loc[1]]
+    # drop the newline that ends the block's last line
+    return block[:-1] if block.endswith('\n') else block
 
 def block_has_content(block: str) -> bool:
     """
@@ -85,24 +113,26 @@ def block_has_content(block: str) -> bool:
         if not line:
             continue
         # skip headings inside the block
-        if re.match(r'^#{1,6}\s+', line):
+        if _is_heading(line):
             continue
         # skip markdown link-only reference lines like "[v0.1.0]: https://..."
-        if re.match(r'^\[.+\]:\s*https?://', line):
+        if _is_link_ref(line):
             continue
-        # If it's a bullet, numbered, or contains alphanumeric text, accept it
-        if re.match(r'^[-*]\s+', line) or re.match(r'^\d+\.\s+', line):
+        # If it's a bullet, accept it
+        if line[0] in '-*' and line[1:2].isspace():
             return True
-        # If it's general text (letters/numbers), accept
-        if re.search(r'\w', line):
+        # If it contains alphanumeric text (this covers numbered items too), accept it
+        if any(ch.isalnum() or ch == '_' for ch in line):
             return True
     return False
 
 def git_latest_tag() -> Optional[str]:
     try:
-        out = subprocess.check_output(["git", "tag", "--sort=-v:refname"], stderr=subprocess.DEVNULL, text=True)
-        tags = [t.strip() for t in out.splitlines() if t.strip()]
-        return tags[0] if tags else None
+        # only the highest version tag is printed, not the full tag list
+        out = subprocess.check_output(
+            ["git", "for-each-ref", "--count=1", "--sort=-v:refname", "--format=%(refname:short)", "refs/tags"],
+            stderr=subprocess.DEVNULL, text=True)
+        return out.strip() or None
     except Exception:
         return None
 
@@ -117,33 +147,44 @@ def git_log_range(prev_tag: Optional[str]) -> str:
     except subprocess.CalledProcessError:
         return ""
 
-def fill_unreleased(text: str, new_block: str) -> str:
+def fill_unreleased(text: str, new_block: str, loc=_UNSET) -> str:
+    # loc: offsets already found by _locate_unreleased (None: no header), located here if not given
+    if loc is _UNSET:
+        loc = _locate_unreleased(text)
     # Use a canonical header
-    lines = text.splitlines()
-    idx = None
-    for i, ln in enumerate(lines):
-        norm = ln.replace('\u00A0', ' ').strip()
-        if 'unreleased' in norm.lower() and norm.lstrip().startswith('#'):
-            idx = i
-            break
     header = "## [Unreleased]\n\n"
-    new_block_text = new_block.rstrip() + "\n\n"
-    if idx is None:
+    if loc is None:
         # prepend to file
-        return header + new_block_text + text
-    # find next top-level header after idx
-    j = idx + 1
-    while j < len(lines):
-        if re.match(r'^\s*##\s+', lines[j]):
-            break
-        j += 1
-    # reconstruct
-    new_lines = lines[: idx+1 ] + [""] + new_block_text.rstrip("\n").splitlines() + [""] + lines[j:]
-    return "\n".join(new_lines)
+        return header + new_block.rstrip() + "\n\n" + text
+    start, end = loc
+    head = text[:start]
+    if not head.endswith('\n'):
+        head += '\n'
+    tail = text[end:]
+    # keep the existing header line, replace the block body
+    return "".join([head, "\n", new_block.rstrip(), "\n\n" if tail else "\n", tail])
+
+def fix_from_git(text: str, loc) -> int:
+    # --fix: populate Unreleased from the git log since the latest tag (one tag lookup, one log call)
+    log = git_log_range(git_latest_tag())
+    if not log:
+        print("No commits found to populate Unreleased.", file=sys.stderr)
+        return 1
+    write_changelog(CHANGELOG, fill_unreleased(text, log, loc))
+    print("Populated 'Unreleased' in CHANGELOG.md from git log.")
+    return 0
 
 def write_changelog(path: str, content: str) -> None:
-    with open(path, "w", encoding="utf-8") as fh:
-        fh.write(content)
+    # write a sibling temp file and swap it in, so readers never see a partial changelog
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as fh:
+            fh.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
 
 def main(argv: List[str] | None = None) -> int:
     import argparse
@@ -158,7 +199,9 @@ def main(argv: List[str] | None = None) -> int:
         return 1
 
     text = read_changelog(CHANGELOG)
-    block = find_unreleased_block_simple(text)
+    # locate once; --fix reuses the offsets instead of rescanning
+    loc = _locate_unreleased(text)
+    block = _block_at(text, loc)
     if args.debug:
         print("----- DEBUG: extracted Unreleased block (raw) -----")
         if block is None:
@@ -171,15 +214,7 @@ def main(argv: List[str] | None = None) -> int:
     if block is None:
         print("ERROR: 'Unreleased' section not found in CHANGELOG.md (expected `## [Unreleased]`)", file=sys.stderr)
         if args.fix:
-            prev = git_latest_tag()
-            log = git_log_range(prev)
-            if not log:
-                print("No commits found to populate Unreleased.", file=sys.stderr)
-                return 1
-            new_text = fill_unreleased(text, log)
-            write_changelog(CHANGELOG, new_text)
-            print("Populated 'Unreleased' in CHANGELOG.md from git log.")
-            return 0
+            return fix_from_git(text, loc)
         return 1
 
     has = block_has_content(block)
@@ -190,15 +225,7 @@ def main(argv: List[str] | None = None) -> int:
 
     print("ERROR: 'Unreleased' section in CHANGELOG.md is empty (no bullets or notes found).", file=sys.stderr)
     if args.fix:
-        prev = git_latest_tag()
-        log = git_log_range(prev)
-        if not log:
-            print("No commits found to populate Unreleased.", file=sys.stderr)
-            return 1
-        new_text = fill_unreleased(text, log)
-        write_changelog(CHANGELOG, new_text)
-        print("Populated 'Unreleased' in CHANGELOG.md from git log.")
-        return 0
+        return fix_from_git(text, loc)
 
     # helpful hints
     print("", file=sys.stderr)
@@ -22,6 +22,7 @@ import argparse
 import os
 import re
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -30,21 +31,27 @@ def run(cmd: list[str]) -> str:
     return subprocess.check_output(cmd, text=True).strip()
 
 
+@lru_cache(maxsize=64)
+def _header_re(version: str) -> re.Pattern:
+    # compiled once per version string
+    return re.compile(
+        rf"^##\s*(?:\[\s*v?{re.escape(version)}\s*\]|v?{re.escape(version)})",
+        re.MULTILINE,
+    )
+
+
 def find_header_line(changelog: str, version: str) -> Optional[int]:
     """
     Match headers like:
       ## [v1.2.3]
       ## v1.2.3
       ## [ v1.2.3 ]
+    Returns the character offset where the header line starts, or None.
     """
-    pattern = re.compile(
-        rf"^##\s*(?:\[\s*v?{re.escape(version)}\s*\]|v?{re.escape(version)})",
-        re.MULTILINE,
-    )
-    match = pattern.search(changelog)
+    match = _header_re(version).search(changelog)
     if not match:
         return None
-    return changelog[: match.start()].count("\n") + 1
+    return match.start()
 
 
 def extract_changelog_section(
@@ -61,16 +68,13 @@ def extract_changelog_section(
         end = find_header_line(changelog_text, base_v)
         if end is None:
             return None  # base not found → fallback
-        end = end - 1
     else:
-        end = None
-
-    lines = changelog_text.splitlines()
-    section = lines[start - 1 : end]
+        end = len(changelog_text)
 
+    # only the section between the two headers is split into lines
     cleaned = []
-    for line in section:
-        if re.match(r"^##+", line):
+    for line in changelog_text[start:end].splitlines():
+        if line.startswith("##"):
             continue
         if not line.strip():
             continue
@@ -83,12 +87,10 @@ def filter_release_commits(log: str) -> str:
     """
     Remove mechanical release/version bump commits from git log output.
     """
-    lines = []
-    for line in log.splitlines():
-        if line.startswith("- chore(release): bump version to"):
-            continue
-        lines.append(line)
-    return "\n".join(lines).strip()
+    return "\n".join(
+        line for line in log.splitlines()
+        if not line.startswith("- chore(release): bump version to")
+    ).strip()
 
 
 def git_log_notes(tag: str, base: Optional[str]) -> str:
@@ -123,7 +125,9 @@ def write_github_output(body: str, compare_url: str):
         f.write(f"compare_url={compare_url}\n")
 
 
+@lru_cache(maxsize=128)
 def git_ref_exists(ref: str) -> bool:
+    # refs do not change while notes are generated: one rev-parse per ref
     try:
         subprocess.check_output(
             ["git", "rev-parse", "--verify", "--quiet", ref],
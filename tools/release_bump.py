@@ -21,22 +21,35 @@ from __future__ import annotations
 import argparse
 import datetime
 import re
+from dataclasses import dataclass
 import sys
 from pathlib import Path
 import os
 
-SEMVER_RE = re.compile(r'^v?(\d+)\.(\d+)\.(\d+)$', re.IGNORECASE)
-HEADING_VER_RE = re.compile(r'^##\s*\[?v?(\d+\.\d+\.\d+)\]?\s*(?:-.*)?$', re.MULTILINE)
-
 START_MARKER = "<!-- VERSION:START -->"
 END_MARKER = "<!-- VERSION:END -->"
 
+# Precompiled patterns for the CHANGELOG/README rewrites
+UNRELEASED_HEADER_RE = re.compile(r'^(##\s*\[Unreleased\].*?)\r?\n', re.MULTILINE)
+NEXT_SECTION_RE = re.compile(r'(^##\s*\[)', re.MULTILINE)
+CHANGELOG_TITLE_RE = re.compile(r'^[^\S\n]*# changelog', re.MULTILINE | re.IGNORECASE)
+
+# One scan over the CHANGELOG: a version heading ("## [vX.Y.Z] - date") captures its
+# number in group "ver"; anything else matched is a reference line ("[vX.Y.Z]: url").
+CHANGELOG_SCAN_RE = re.compile(
+    r'^##\s*\[?v?(?P<ver>\d+\.\d+\.\d+)\]?[^\S\n]*(?:-.*)?$'
+    r'|^\s*\[v?\d+\.\d+\.\d+\]:.*\n?',
+    re.MULTILINE)
+
 def normalize_strip_v(version: str) -> str:
     v = version.strip()
-    m = SEMVER_RE.match(v)
-    if not m:
+    if v[:1] in ('v', 'V'):
+        v = v[1:]
+    # X.Y.Z: exactly three non-empty runs of digits
+    parts = v.split('.')
+    if len(parts) != 3 or not all(part.isdecimal() for part in parts):
         raise SystemExit(f"VERSION '{version}' is not valid semver (expected X.Y.Z or vX.Y.Z)")
-    return f"{m.group(1)}.{m.group(2)}.{m.group(3)}"
+    return v
 
 def bump_minor_numeric(numeric: str) -> str:
     major, minor, patch = map(int, numeric.split('.'))
@@ -44,108 +57,169 @@ def bump_minor_numeric(numeric: str) -> str:
     patch = 0
     return f"{major}.{minor}.{patch}"
 
-def write_or_preview(path: Path, content: str, dry_run: bool):
+def write_texts_atomic(outputs: list[tuple[Path, str]]):
+    # stage every file as a sibling temp first and only then swap them all in, so a
+    # failure part-way leaves every real file untouched; content is encoded once up
+    # front and written as bytes (no text-mode newline translation)
+    staged = []
+    try:
+        for path, content in outputs:
+            tmp = path.with_name(path.name + '.tmp')
+            staged.append(tmp)
+            tmp.write_bytes(content.encode('utf-8'))
+    except BaseException:
+        for tmp in staged:
+            tmp.unlink(missing_ok=True)
+        raise
+    for (path, _), tmp in zip(outputs, staged):
+        os.replace(tmp, path)
+
+def preview_text(title: str, content: str):
+    # stream the pieces instead of formatting one string the size of the whole file
+    out = sys.stdout
+    out.write(f"[dry-run] {title}:\n---\n")
+    out.write(content)
+    out.write("\n---\n\n")
+
+def write_or_preview(path: Path, content: str, dry_run: bool, pending: list[tuple[Path, str]]):
     if dry_run:
-        print(f"[dry-run] Would write to {path}:\n---\n{content}\n---\n")
+        preview_text(f"Would write to {path}", content)
     else:
-        path.write_text(content, encoding='utf-8')
+        pending.append((path, content))
 
 def ensure_marker_in_text(original: str, marker_content: str = None) -> str:
     if START_MARKER in original and END_MARKER in original:
         return original
     insert_block = f"{START_MARKER}{marker_content or ''}{END_MARKER}"
-    if "# Changelog" in original:
-        parts = original.splitlines(True)
-        for i, line in enumerate(parts):
-            if line.strip().lower().startswith("# changelog"):
-                parts.insert(i+1, "\n" + insert_block + "\n\n")
-                return "".join(parts)
+    m = CHANGELOG_TITLE_RE.search(original)
+    # the title must also appear verbatim as '# Changelog'; when the matched title is spelled
+    # exactly that way the separate substring scan is skipped
+    if m and (m.group().endswith("# Changelog") or "# Changelog" in original):
+        # splice right after the title line instead of splitting the whole text into lines
+        eol = original.find("\n", m.end())
+        cut = len(original) if eol < 0 else eol + 1
+        return "".join((original[:cut], "\n", insert_block, "\n\n", original[cut:]))
     return insert_block + "\n\n" + original
 
 def replace_between_markers_in_text(original: str, new_tag: str) -> (str, bool):
-    pattern = re.compile(re.escape(START_MARKER) + r'(.*?)' + re.escape(END_MARKER), flags=re.DOTALL)
-    m = pattern.search(original)
-    if not m:
+    # markers are literals: locate them with str.find instead of a DOTALL regex
+    start = original.find(START_MARKER)
+    if start < 0:
         return original, False
-    replaced = pattern.sub(f"{START_MARKER}{new_tag}{END_MARKER}", original, count=1)
+    end = original.find(END_MARKER, start + len(START_MARKER))
+    if end < 0:
+        return original, False
+    replaced = "".join((original[:start], START_MARKER, new_tag, END_MARKER, original[end + len(END_MARKER):]))
     return replaced, (replaced != original)
 
 def process_changelog_in_memory(original: str, new_tag: str, date_str: str) -> (str, str):
     original_with_marker = ensure_marker_in_text(original, marker_content="")
-    m = re.search(r'^(##\s*\[Unreleased\].*?)\r?\n', original_with_marker, flags=re.MULTILINE)
+    m = UNRELEASED_HEADER_RE.search(original_with_marker)
     if not m:
         text_after_marker_repl, _ = replace_between_markers_in_text(original_with_marker, new_tag)
         return text_after_marker_repl, ""
-    parts = re.split(r'^(##\s*\[Unreleased\].*?)\r?\n', original_with_marker, maxsplit=1, flags=re.MULTILINE)
-    before = parts[0]
-    header = parts[1]
-    rest = parts[2] if len(parts) > 2 else ""
-    m_next = re.search(r'(^##\s*\[)', rest, flags=re.MULTILINE)
-    if m_next:
-        unreleased_body = rest[:m_next.start()]
-        after = rest[m_next.start():]
-    else:
-        unreleased_body = rest
-        after = ""
-    unreleased_body = unreleased_body.rstrip("\r\n")
+    # split around the header match found above (no second scan); the next section is
+    # searched from the header end by offset, so the tail is never copied out first
+    before = original_with_marker[:m.start()]
+    header = m.group(1)
+    body_start = m.end()
+    m_next = NEXT_SECTION_RE.search(original_with_marker, body_start)
+    split = m_next.start() if m_next else len(original_with_marker)
+    # back over the trailing newlines by index so the body is sliced exactly once
+    body_end = split
+    while body_end > body_start and original_with_marker[body_end - 1] in "\r\n":
+        body_end -= 1
+    unreleased_body = original_with_marker[body_start:body_end]
+    after = original_with_marker[split:]
     if not unreleased_body.strip():
         text_after_marker_repl, _ = replace_between_markers_in_text(original_with_marker, new_tag)
         return text_after_marker_repl, ""
     new_section = f"## [{new_tag}] - {date_str}\n\n{unreleased_body}\n\n"
-    new_changelog = before + header + "\n\n" + new_section + after.lstrip("\r\n")
+    new_changelog = "".join((before, header, "\n\n", new_section, after.lstrip("\r\n")))
     new_changelog_with_marker, _ = replace_between_markers_in_text(new_changelog, new_tag)
     return new_changelog_with_marker, new_section
 
-def collect_versions_from_changelog_text(changelog_text: str) -> list[str]:
-    found = HEADING_VER_RE.findall(changelog_text)
+def split_refs_and_versions(changelog_text: str) -> (list[str], list[str]):
+    # returns (text pieces between reference lines, version tags newest first) from a single scan
+    chunks = []
     seen = []
-    for v in found:
+    pos = 0
+    for m in CHANGELOG_SCAN_RE.finditer(changelog_text):
+        v = m.group('ver')
+        if v is None:
+            chunks.append(changelog_text[pos:m.start()])
+            pos = m.end()
+            continue
         tag = f"v{v}"
         if not seen or seen[-1] != tag:
             seen.append(tag)
-    return seen
-
-def remove_existing_reference_block(changelog_text: str) -> str:
-    cleaned = re.sub(r'(?m)^\s*\[v?\d+\.\d+\.\d+\]:.*\n?', '', changelog_text)
-    return cleaned
-
-def rewrite_reference_block_text(changelog_text_no_refs: str, versions: list[str], repo: str) -> str:
-    if not repo or not versions:
-        return changelog_text_no_refs
-    lines = []
-    for i, cur in enumerate(versions):
-        if i + 1 < len(versions):
-            prev = versions[i+1]
-            url = f"https://github.com/{repo}/compare/{prev}...{cur}"
-        else:
-            url = f"https://github.com/{repo}/tree/{cur}"
-        lines.append(f"[{cur}]: {url}")
-    block = "\n".join(lines) + "\n"
-    return changelog_text_no_refs.rstrip() + "\n\n" + block
+    chunks.append(changelog_text[pos:])
+    return chunks, seen
+
+def build_reference_block(versions: list[str], repo: str) -> str:
+    # adjacent (newer, older) pairs compare; the oldest version links to its tree
+    base = f"https://github.com/{repo}"
+    lines = [f"[{cur}]: {base}/compare/{prev}...{cur}"
+             for cur, prev in zip(versions, versions[1:])]
+    oldest = versions[-1]
+    lines.append(f"[{oldest}]: {base}/tree/{oldest}")
+    return "\n".join(lines)
+
+@dataclass(frozen=True, slots=True)
+class ChangelogRebuild:
+    text: str            # final CHANGELOG contents
+    moved_section: str   # the new version section ("" when Unreleased was empty)
+    versions: list[str]  # version tags newest first, as listed in the reference block
+
+    @property
+    def had_unreleased(self) -> bool:
+        # the moved section is only produced for a non-empty Unreleased body
+        return bool(self.moved_section)
+
+def rebuild_changelog(original: str, new_tag: str, date_str: str, repo: str) -> ChangelogRebuild:
+    # move Unreleased, strip old refs and append the regenerated block; the final text is
+    # joined once from the scan pieces instead of materializing each intermediate stage
+    text, moved_section = process_changelog_in_memory(original, new_tag, date_str)
+    chunks, versions = split_refs_and_versions(text)
+    if versions and versions[0] != new_tag:
+        if new_tag not in versions:
+            versions.insert(0, new_tag)
+    elif not versions:
+        versions = [new_tag]
+    if repo:
+        # rstrip() across the piece boundaries, then add the block
+        while chunks and not chunks[-1].strip():
+            chunks.pop()
+        if chunks:
+            chunks[-1] = chunks[-1].rstrip()
+        chunks += ("\n\n", build_reference_block(versions, repo), "\n")
+    return ChangelogRebuild("".join(chunks), moved_section, versions)
 
 def prepare_readme_text(original: str, new_tag: str) -> (str, bool):
     text_with_marker = original
     if START_MARKER not in original or END_MARKER not in original:
         if original.startswith('#'):
-            parts = original.splitlines(True)
-            insert_at = 1
-            parts.insert(insert_at, "\n" + START_MARKER + END_MARKER + "\n\n")
-            text_with_marker = "".join(parts)
+            # splice after the title line; only that line is split, not the whole README
+            eol = original.find('\n')
+            head = original if eol < 0 else original[:eol + 1]
+            cut = len(head.splitlines(True)[0])
+            text_with_marker = "".join((original[:cut], "\n", START_MARKER, END_MARKER, "\n\n", original[cut:]))
         else:
             text_with_marker = START_MARKER + END_MARKER + "\n\n" + original
     final_text, changed = replace_between_markers_in_text(text_with_marker, new_tag)
     return final_text, changed
 
-def write_release_notes_file(release_section: str, dry_run: bool, path: Path = Path("release_notes.md")):
+def write_release_notes_file(release_section: str, dry_run: bool, pending: list[tuple[Path, str]],
+                             path: Path = Path("release_notes.md")):
     if not release_section.strip():
         if dry_run:
             print("[dry-run] No Unreleased content to include as release notes.")
         return False
     content = release_section.strip() + "\n"
     if dry_run:
-        print(f"[dry-run] Would write release notes to {path}:\n---\n{content}\n---\n")
+        preview_text(f"Would write release notes to {path}", content)
     else:
-        path.write_text(content, encoding='utf-8')
+        pending.append((path, content))
     return True
 
 def main():
@@ -163,9 +237,11 @@ def main():
     readme_path = Path(args.readme)
     repo = args.repo or os.environ.get('GITHUB_REPOSITORY')
 
-    if not version_path.exists():
-        raise SystemExit(f"VERSION file '{version_path}' not found")
-    current_raw = version_path.read_text(encoding='utf-8').strip()
+    # open directly and handle the missing file, instead of a separate exists() stat
+    try:
+        current_raw = version_path.read_text(encoding='utf-8').strip()
+    except FileNotFoundError:
+        raise SystemExit(f"VERSION file '{version_path}' not found") from None
     current_numeric = normalize_strip_v(current_raw)
     new_numeric = bump_minor_numeric(current_numeric)
     new_tag = f"v{new_numeric}"
@@ -177,54 +253,45 @@ def main():
     print(f"Dry-run: {args.dry_run}")
     print(f"No release notes flag: {args.no_release_notes}")
 
-    changelog_original_text = changelog_path.read_text(encoding='utf-8') if changelog_path.exists() else "# Changelog\n\n## [Unreleased]\n\n"
-    changelog_after_move, moved_section = process_changelog_in_memory(changelog_original_text, new_tag, date_str)
+    try:
+        changelog_original_text = changelog_path.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        changelog_original_text = "# Changelog\n\n## [Unreleased]\n\n"
+    changelog = rebuild_changelog(changelog_original_text, new_tag, date_str, repo)
 
-    changelog_no_refs = remove_existing_reference_block(changelog_after_move)
-    versions = collect_versions_from_changelog_text(changelog_after_move)
-    if versions and versions[0] != new_tag:
-        if new_tag not in versions:
-            versions.insert(0, new_tag)
-    elif not versions:
-        versions = [new_tag]
-    final_changelog_text = rewrite_reference_block_text(changelog_no_refs, versions, repo)
-
-    readme_original_text = readme_path.read_text(encoding='utf-8') if readme_path.exists() else ""
+    try:
+        readme_original_text = readme_path.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        readme_original_text = ""
     final_readme_text, readme_changed = ("", False)
     if readme_original_text != "":
         final_readme_text, readme_changed = prepare_readme_text(readme_original_text, new_tag)
 
     final_version_text = f"{new_tag}\n"
 
-    # Write preview/write files
-    write_or_preview(version_path, final_version_text, args.dry_run)
-    write_or_preview(changelog_path, final_changelog_text, args.dry_run)
+    # Preview files, or queue them to be written together below
+    pending = []
+    write_or_preview(version_path, final_version_text, args.dry_run, pending)
+    write_or_preview(changelog_path, changelog.text, args.dry_run, pending)
     if readme_original_text != "":
-        write_or_preview(readme_path, final_readme_text, args.dry_run)
+        write_or_preview(readme_path, final_readme_text, args.dry_run, pending)
 
     # Write release_notes.md only if not skipped
     wrote_release_notes = False
     if not args.no_release_notes:
-        wrote_release_notes = write_release_notes_file(moved_section, args.dry_run, path=Path("release_notes.md"))
+        wrote_release_notes = write_release_notes_file(changelog.moved_section, args.dry_run, pending, path=Path("release_notes.md"))
     else:
         if args.dry_run:
             print("[dry-run] Skipping creation of release_notes.md due to --no-release-notes")
 
+    if pending:
+        write_texts_atomic(pending)
+
     print("Summary:")
     print(f" - VERSION -> {final_version_text.strip()}")
-    had_unreleased = False
-    if re.search(r'##\s*\[Unreleased\]', changelog_original_text):
-        parts = re.split(r'^(##\s*\[Unreleased\].*?)\r?\n', changelog_original_text, maxsplit=1, flags=re.MULTILINE)
-        rest = parts[2] if len(parts) > 2 else ""
-        m_next = re.search(r'(^##\s*\[)', rest, flags=re.MULTILINE)
-        if m_next:
-            unreleased_body = rest[:m_next.start()].strip()
-        else:
-            unreleased_body = rest.strip()
-        had_unreleased = bool(unreleased_body)
-    print(f" - CHANGELOG Unreleased moved: {'yes' if had_unreleased else 'no (empty)'}")
+    print(f" - CHANGELOG Unreleased moved: {'yes' if changelog.had_unreleased else 'no (empty)'}")
     print(f" - README marker replaced: {'yes' if readme_changed else 'none or file missing'}")
-    print(f" - Version refs regenerated: {'yes' if repo and versions else 'no (repo missing or no versions)'}")
+    print(f" - Version refs regenerated: {'yes' if repo and changelog.versions else 'no (repo missing or no versions)'}")
     print(f" - Release notes written to release_notes.md: {'yes' if wrote_release_notes else 'no (skipped/empty)'}")
 
     # final output: new tag for CI